@@ -1,16 +1,48 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
+import functools
 import logging
 import math
 import json
+import threading
+import time
 import traceback
-from typing import Dict, Any, List, Optional, Union
-from services.r_integration import send_to_r_for_analysis
+from collections import Counter, OrderedDict
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+import numpy as np
+
+from services.r_integration import (
+    RSession,
+    is_r_available,
+    send_to_r_for_analysis,
+    send_to_r_for_analysis_bulk,
+    get_weather_data as _get_weather_data,
+    get_recommendations as _get_recommendations
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _freeze(data: Any) -> Any:
+    """
+    Converte dicionários aninhados em visões somente leitura (MappingProxyType)
+
+    Args:
+        data (Any): Estrutura a ser congelada
+
+    Returns:
+        Any: Mesma estrutura, com todos os dicionários protegidos contra alteração
+    """
+    if isinstance(data, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in data.items()})
+    return data
+
+
 
 class CultureController:
     """
@@ -19,7 +51,7 @@ class CultureController:
     """
 
     # parâmetros recomendados para cultivo de cana-de-açúcar por ciclo
-    SUGARCANE_RECOMMENDATIONS = {
+    SUGARCANE_RECOMMENDATIONS = _freeze({
         "curto": {
             "espacamento": {
                 "min": 1.4,
@@ -98,11 +130,11 @@ class CultureController:
                 "description": "Prioriza cobertura de grandes áreas"
             }
         }
-    }
+    })
 
 
     # parâmetros recomendados para cultivo de soja por variedade
-    SOYBEAN_RECOMMENDATIONS = {
+    SOYBEAN_RECOMMENDATIONS = _freeze({
         "convencional": {
             "espacamento": {
                 "min": 0.4,
@@ -155,23 +187,211 @@ class CultureController:
                 "description": "Maior resistência ao déficit hídrico"
             }
         }
+    })
+
+
+    # nome exibido de cada tipo de cultura
+    CULTURE_TYPE_LABELS = {
+        1: "Soja",
+        2: "Cana-de-Açúcar"
+    }
+
+
+    # configuração de cada tipo de cultura usada em create_culture
+    _CULTURE_SPECS = {
+        1: {  # Soja
+            "strategy": "quadrado",
+            "param": "variedade",
+            "default": "convencional",
+            "validator": "validate_soybean_parameters"
+        },
+        2: {  # Cana-de-Açúcar
+            "strategy": "retangular",
+            "param": "ciclo",
+            "default": "médio",
+            "validator": "validate_sugarcane_parameters"
+        }
+    }
+
+
+    # campo categórico (variedade/ciclo) de cada tipo de cultura, pelo nome exibido
+    _CATEGORY_FIELDS = {
+        "Soja": "variedade",
+        "Cana-de-Açúcar": "ciclo"
+    }
+
+
+    # análises meteorológicas copiadas para os dados enviados às recomendações
+    # (chave em data.analysis -> chave nos dados meteorológicos)
+    _WEATHER_ANALYSIS_FIELDS = (
+        ("temperature", "temperature_analysis"),
+        ("humidity", "humidity_analysis"),
+        ("wind", "wind_analysis"),
+        ("agricultural_impact", "agricultural_impact")
+    )
+
+    # campos da cultura lidos por r/modules/recommendations.R; só eles
+    # compõem a chave do cache de recomendações
+    _RECOMMENDATION_CULTURE_FIELDS = (
+        "tipo", "area", "irrigacao", "variedade", "ciclo",
+        "quantidade_herbicida", "quantidade_fertilizante", "dosagem_herbicida",
+        "linhas_calculadas", "metros_lineares_total", "consumo_agua"
+    )
+
+    # recomendações genéricas usadas quando faltam dados meteorológicos
+    _BASIC_WEATHER_RECOMMENDATIONS = {
+        "irrigation": "Verificar condições locais antes de decidir sobre irrigação.",
+        "chemicals_application": "Verificar previsão do tempo antes de aplicar defensivos.",
+        "fieldwork": "Planejar atividades de campo com base na previsão meteorológica local."
+    }
+
+
+    # validade dos dados meteorológicos em cache, em segundos
+    WEATHER_CACHE_TTL = 600
+
+
+    # número máximo de localidades com dados meteorológicos em cache
+    WEATHER_CACHE_SIZE = 32
+
+
+    # número máximo de recomendações do R mantidas em cache
+    RECOMMENDATIONS_CACHE_SIZE = 256
+
+
+    # intervalo, em segundos, para verificar novamente se o R ficou disponível
+    R_PROBE_INTERVAL = 60
+
+
+    # dosagens de insumos por tipo de cultura (1=Soja, 2=Cana-de-Açúcar)
+    INPUT_DOSAGES = {
+        1: {
+            "dosagem_herbicida": 2.5,     # L/ha para Glifosato
+            "dosagem_fertilizante": 300   # kg/ha para NPK
+        },
+        2: {
+            "dosagem_herbicida": 3.0,     # L/ha para herbicida de cana
+            "dosagem_fertilizante": 400   # kg/ha para NPK+Micro
+        }
     }
 
 
-    def __init__(self):
-        """Inicializa o controlador de culturas"""
+    # layout das culturas geradas em lote como array estruturado NumPy
+    # (parametro_id indexa a lista "param_options" retornada junto com os dados)
+    RANDOM_CULTURE_DTYPE = np.dtype([
+        ("area", "f8"),
+        ("espacamento", "f8"),
+        ("irrigacao", "?"),
+        ("parametro_id", "u1"),
+        ("linhas_calculadas", "i8"),
+        ("dosagem_herbicida", "f8"),
+        ("dosagem_fertilizante", "f8"),
+        ("quantidade_herbicida", "f8"),
+        ("quantidade_fertilizante", "f8"),
+        ("comprimento_linha", "f8"),
+        ("metros_lineares_total", "f8"),
+        ("consumo_agua", "f8")
+    ])
+
+
+    # explicações das estatísticas formatadas, compartilhadas por todas as culturas
+    # (somente leitura; serializadas para o frontend junto com os dados)
+    _EXPLICACOES_ESTATISTICAS = {
+        "media": "Média aritmética dos valores (soma dividida pelo número de observações)",
+        "desvio_padrao": "Medida de dispersão que indica quanto os valores estão espalhados em relação à média",
+        "coeficiente_variacao": "Desvio padrão relativo à média, expresso em porcentagem. Útil para comparar variabilidade entre diferentes conjuntos de dados",
+        "erro_padrao": "Estimativa da variabilidade da média amostral em relação à média populacional",
+        "intervalo_confianca": "Intervalo onde a média populacional tem 95% de probabilidade de estar contida",
+        "amplitude": "Diferença entre o valor máximo e mínimo",
+        "mediana": "Valor central que divide o conjunto de dados em duas partes iguais",
+        "q1": "Primeiro quartil - 25% dos valores estão abaixo deste ponto",
+        "q3": "Terceiro quartil - 75% dos valores estão abaixo deste ponto",
+        "iqr": "Intervalo interquartil - diferença entre Q3 e Q1, usado para identificar outliers"
+    }
+
+
+    # descrições das estatísticas do conjunto gerado (compartilhadas por todos os campos)
+    _STAT_DESCRIPTIONS = {
+        "mean": "Média aritmética dos valores",
+        "median": "Valor central que divide a distribuição ao meio",
+        "std_dev": "Desvio padrão: medida de dispersão dos valores em relação à média",
+        "variance": "Variância: média dos quadrados dos desvios em relação à média",
+        "coefficient_of_variation": "Coeficiente de variação: desvio padrão relativo à média (%)",
+        "std_error": "Erro padrão: estimativa do desvio padrão da média amostral",
+        "min": "Valor mínimo encontrado",
+        "max": "Valor máximo encontrado",
+        "range": "Amplitude: diferença entre o maior e o menor valor",
+        "q1": "Primeiro quartil: 25% dos valores são menores que este",
+        "q3": "Terceiro quartil: 75% dos valores são menores que este",
+        "iqr": "Intervalo interquartil: diferença entre Q3 e Q1"
+    }
+
+
+    # campos calculados incluídos nas estatísticas do conjunto gerado, quando presentes
+    _CALCULATED_NUMERIC_FIELDS = (
+        "linhas_calculadas",
+        "quantidade_herbicida",
+        "quantidade_fertilizante",
+        "metros_lineares_total"
+    )
+
+
+    # explicações gerais das estatísticas do conjunto gerado
+    _STAT_EXPLANATION = {
+        "desvio_padrao": "O desvio padrão é uma medida estatística que indica quanto os valores da amostra variam em relação à média. "
+                        "Um desvio padrão baixo indica que os valores tendem a estar próximos da média, enquanto um desvio padrão alto "
+                        "indica que os valores estão espalhados por uma gama mais ampla. É calculado como a raiz quadrada da variância.",
+        "variancia": "A variância mede a dispersão dos valores em relação à média, calculando a média dos quadrados dos desvios. "
+                    "Quanto maior a variância, mais dispersos estão os valores em relação à média.",
+        "erro_padrao": "O erro padrão é uma estimativa do desvio padrão da média amostral. Ele indica a precisão da estimativa da média "
+                      "populacional baseada na amostra atual. Um erro padrão menor indica uma estimativa mais precisa da média."
+    }
+
+
+    def __init__(self, r_enabled: bool = True):
+        """
+        Inicializa o controlador de culturas
+
+        Args:
+            r_enabled (bool, optional): Se as culturas criadas devem ser enviadas
+                para análise estatística no R
+        """
+        # análise no R é opcional (cada chamada tem custo alto)
+        self.r_enabled = r_enabled
+
         # registro de estratégias de cálculo (Strategy Pattern)
         self.calculation_strategies = {
             "quadrado": self._calculate_square_strategy,
             "retangular": self._calculate_rectangular_strategy
         }
 
-        # cache de dados meteorológicos (pode ser atualizado periodicamente)
-        self.weather_data = None
+        # versões vetorizadas das estratégias, usadas no cálculo em lote
+        self.batch_calculation_strategies = {
+            "quadrado": self._calculate_square_strategy_batch,
+            "retangular": self._calculate_rectangular_strategy_batch
+        }
+
+        # cache LRU de dados meteorológicos por localidade, com entradas
+        # (instante, dados) renovadas após WEATHER_CACHE_TTL segundos; o lock
+        # protege o OrderedDict das requisições concorrentes da API web
+        self._weather_cache = OrderedDict()
+        self._weather_lock = threading.Lock()
+
+        # cache LRU de recomendações, indexado pelos campos lidos pelo R
+        self._recommendations_cache = OrderedDict()
+        self._recommendations_lock = threading.Lock()
+
+        # processo R persistente, iniciado sob demanda na primeira análise
+        self._r_conn = RSession()
+
+        # disponibilidade do R (None = ainda não verificada) e instante da verificação
+        self._r_available: Optional[bool] = None
+        self._r_probe_time = 0.0
 
 
     def create_culture(self, culture_type: int, area: float, espacamento: float, 
-                      with_irrigation: bool = False, **kwargs) -> Dict[str, Any]:
+                      with_irrigation: bool = False, _defer_r_analysis: bool = False,
+                      _linhas_calculadas: Optional[int] = None,
+                      _insumos_calculados: Optional[Dict[str, float]] = None, **kwargs) -> Dict[str, Any]:
         """
         Cria uma nova cultura com os parâmetros especificados
 
@@ -180,6 +400,12 @@ class CultureController:
             area (float): Área de plantio em hectares
             espacamento (float): Espaçamento entre linhas em metros
             with_irrigation (bool, optional): Se deve incluir sistema de irrigação
+            _defer_r_analysis (bool, optional): Uso interno; não envia os dados ao R
+                para que a análise seja feita em lote pelo chamador
+            _linhas_calculadas (Optional[int], optional): Uso interno; número de linhas
+                já calculado em lote pelo chamador
+            _insumos_calculados (Optional[Dict[str, float]], optional): Uso interno;
+                quantidades de insumos já calculadas em lote pelo chamador
             **kwargs: Parâmetros adicionais específicos para cada cultura
 
         Returns:
@@ -192,155 +418,267 @@ class CultureController:
         if espacamento <= 0:
             raise ValueError("O espaçamento entre linhas deve ser maior que zero")
 
-        # cria dados básicos da cultura
-        culture_data = {
-            "area": area,
-            "espacamento": espacamento,
-            "irrigacao": with_irrigation
-        }
+        # configuração do tipo de cultura (estratégia, parâmetro específico e validador)
+        spec = self._CULTURE_SPECS.get(culture_type)
+        if spec is None:
+            raise ValueError(f"Tipo de cultura inválido: {culture_type}")
 
-        # adiciona dados específicos por tipo de cultura
-        if culture_type == 1:  # Soja
-            strategy = "quadrado"
-            variedade = kwargs.get("variedade", "convencional")
-            culture_data.update({
-                "tipo": "Soja",
-                "variedade": variedade,
-                "strategy": strategy
-            })
-
-            # valida e obtém recomendações para soja
-            recommendations = self.validate_soybean_parameters(area, espacamento, variedade, with_irrigation)
-            culture_data["recomendacoes"] = recommendations
-
-            # parâmetros específicos para soja
-            culture_data["dosagem_herbicida"] = 2.5     # L/ha para Glifosato
-            culture_data["dosagem_fertilizante"] = 300  # kg/ha para NPK
-
-        elif culture_type == 2:  # Cana-de-Açúcar
-            strategy = "retangular"
-            
-            # obtém ciclo ou usar valor padrão
-            ciclo = kwargs.get("ciclo", "médio")
-            culture_data.update({
-                "tipo": "Cana-de-Açúcar",
-                "ciclo": ciclo,
-                "strategy": strategy
-            })
-
-            # valida e obtém recomendações para cana-de-açúcar
-            recommendations = self.validate_sugarcane_parameters(area, espacamento, ciclo, with_irrigation)
-            culture_data["recomendacoes"] = recommendations
-
-            # parâmetros específicos para cana
-            culture_data["dosagem_herbicida"] = 3.0  # L/ha para herbicida de cana
-            culture_data["dosagem_fertilizante"] = 400  # kg/ha para NPK+Micro
+        strategy = spec["strategy"]
+        param_name = spec["param"]
+        param_value = kwargs.get(param_name, spec["default"])
+        dosagens = self.INPUT_DOSAGES[culture_type]
 
-        else:
-            raise ValueError(f"Tipo de cultura inválido: {culture_type}")
+        # valida e obtém recomendações para a cultura
+        validator = getattr(self, spec["validator"])
+        recomendacoes = validator(area, espacamento, param_value, with_irrigation)
 
         # cálculo do número de linhas baseado na estratégia
-        linhas = self.calculate_lines_by_strategy(strategy, area, espacamento)
-        culture_data["linhas_calculadas"] = linhas
+        if _linhas_calculadas is None:
+            # espaçamento já validado acima
+            linhas = self._calculate_lines_unchecked(strategy, area, espacamento)
+        else:
+            linhas = _linhas_calculadas
+
+        # área em m² (1 ha = 10000 m²), usada nos insumos e no consumo de água
+        area_m2 = area * 10000
+
+        # monta os dados da cultura de uma só vez, já com todos os campos conhecidos
+        culture_data = {
+            "area": area,
+            "espacamento": espacamento,
+            "irrigacao": with_irrigation,
+            "tipo": self.CULTURE_TYPE_LABELS[culture_type],
+            param_name: param_value,
+            "strategy": strategy,
+            "recomendacoes": recomendacoes,
+            "dosagem_herbicida": dosagens["dosagem_herbicida"],
+            "dosagem_fertilizante": dosagens["dosagem_fertilizante"],
+            "linhas_calculadas": linhas
+        }
 
         # cálculo de insumos
-        self._calculate_inputs(culture_data)
+        if _insumos_calculados is None:
+            self._calculate_inputs(
+                culture_data, area, dosagens["dosagem_herbicida"], dosagens["dosagem_fertilizante"],
+                linhas, espacamento, area_m2
+            )
+        else:
+            culture_data.update(_insumos_calculados)
 
         # se tiver irrigação, calcule consumo de água
         if with_irrigation:
             irrigation_rate = 0.8  # Taxa de irrigação em L/m²
-            culture_data["consumo_agua"] = area * 10000 * irrigation_rate  # em litros
+            culture_data["consumo_agua"] = area_m2 * irrigation_rate  # em litros
+
+        # a análise no R pode estar desativada ou ser adiada para envio em lote
+        # (ver generate_random_cultures)
+        if _defer_r_analysis or not self._r_analysis_enabled():
+            return culture_data
 
         # envia dados para análise no R e processa os resultados estatísticos
         try:
-            r_analysis = send_to_r_for_analysis(culture_data)
-            if r_analysis:
-                culture_data["analise_estatistica"] = r_analysis
-
-                # extrai e formatar estatísticas para uso no frontend
-                if "input_summary" in r_analysis:
-                    summary = r_analysis["input_summary"]
-                    # formata estatísticas para exibição
-                    formatted_stats = {}
-                    
-                    for field, stats in summary.items():
-                        if isinstance(stats, dict) and "mean" in stats and "std_dev" in stats:
-                            # cria um dicionário com estatísticas mais detalhadas
-                            formatted_stats[field] = {
-                                "media": round(stats["mean"], 2) if not isinstance(stats["mean"], str) else stats["mean"],
-                                "desvio_padrao": round(stats["std_dev"], 2) if not isinstance(stats["std_dev"], str) else stats["std_dev"],
-                                "coeficiente_variacao": round((stats["std_dev"] / stats["mean"]) * 100, 2) if not isinstance(stats["std_dev"], str) and not isinstance(stats["mean"], str) and stats["mean"] != 0 else "N/A",
-                                "erro_padrao": round(stats["std_dev"] / (stats["n"] ** 0.5), 2) if not isinstance(stats["std_dev"], str) and stats.get("n", 0) > 0 else "N/A",
-                                "intervalo_confianca": [
-                                    round(stats.get("conf_low", stats["mean"] - 1.96 * stats["std_dev"] / (stats["n"] ** 0.5)), 2),
-                                    round(stats.get("conf_high", stats["mean"] + 1.96 * stats["std_dev"] / (stats["n"] ** 0.5)), 2)
-                                ] if not isinstance(stats["mean"], str) and not isinstance(stats["std_dev"], str) and stats.get("n", 0) > 0 else ["N/A", "N/A"],
-                                "minimo": stats.get("min", "N/A"),
-                                "maximo": stats.get("max", "N/A"),
-                                "amplitude": round(stats.get("max", 0) - stats.get("min", 0), 2) if "max" in stats and "min" in stats else "N/A",
-                                "mediana": stats.get("median", "N/A"),
-                                "q1": stats.get("q1", "N/A"),
-                                "q3": stats.get("q3", "N/A"),
-                                "iqr": stats.get("iqr", "N/A"),
-                                "tamanho_amostra": stats.get("n", 0)
-                            }
-                    
-                    if formatted_stats:
-                        # adiciona explicações sobre as estatísticas
-                        culture_data["estatisticas_formatadas"] = formatted_stats
-                        culture_data["explicacoes_estatisticas"] = {
-                            "media": "Média aritmética dos valores (soma dividida pelo número de observações)",
-                            "desvio_padrao": "Medida de dispersão que indica quanto os valores estão espalhados em relação à média",
-                            "coeficiente_variacao": "Desvio padrão relativo à média, expresso em porcentagem. Útil para comparar variabilidade entre diferentes conjuntos de dados",
-                            "erro_padrao": "Estimativa da variabilidade da média amostral em relação à média populacional",
-                            "intervalo_confianca": "Intervalo onde a média populacional tem 95% de probabilidade de estar contida",
-                            "amplitude": "Diferença entre o valor máximo e mínimo",
-                            "mediana": "Valor central que divide o conjunto de dados em duas partes iguais",
-                            "q1": "Primeiro quartil - 25% dos valores estão abaixo deste ponto",
-                            "q3": "Terceiro quartil - 75% dos valores estão abaixo deste ponto",
-                            "iqr": "Intervalo interquartil - diferença entre Q3 e Q1, usado para identificar outliers"
-                        }
-
-                
-                # processa análises estatísticas avançadas, se disponíveis
-                if "statistical_analysis" in r_analysis:
-                    stat_analysis = r_analysis["statistical_analysis"]
-                    
-                    # extrai informações sobre outliers se existirem
-                    outliers_info = {}
-                    for key, value in stat_analysis.items():
-                        if key.endswith("_outliers") and "n_outliers" in value and value["n_outliers"] > 0:
-                            field = key.replace("_outliers", "")
-                            outliers_info[field] = {
-                                "quantidade": value["n_outliers"],
-                                "porcentagem": round(value.get("percentage", 0), 2),
-                                "valores": value.get("outliers", []),
-                                "metodo": value.get("method", "desconhecido")
-                            }
-                    
-                    if outliers_info:
-                        culture_data["outliers_detectados"] = outliers_info
-                    
-                    # extrai informações sobre tendências se existirem
-                    trends_info = {}
-                    for key, value in stat_analysis.items():
-                        if key.endswith("_trend") and "trend" in value:
-                            field = key.replace("_trend", "")
-                            trends_info[field] = {
-                                "tendencia": value["trend"],
-                                "inclinacao": value.get("slope", "N/A"),
-                                "significancia": value.get("significance", "N/A"),
-                                "metodo": value.get("method", "análise simples")
-                            }
-                    
-                    if trends_info:
-                        culture_data["analise_tendencia"] = trends_info
+            r_analysis = send_to_r_for_analysis(culture_data, session=self._r_conn)
+            self._apply_r_analysis(culture_data, r_analysis)
         except Exception as e:
-            logger.warning(f"Não foi possível obter análise R completa: {str(e)}")
+            logger.warning("Não foi possível obter análise R completa: %s", e)
             
         return culture_data
 
 
+    def _r_analysis_enabled(self) -> bool:
+        """
+        Indica se as culturas devem ser enviadas para análise no R
+
+        A presença do Rscript é verificada uma vez e o resultado reaproveitado;
+        quando ausente, nova verificação só ocorre após R_PROBE_INTERVAL segundos,
+        para que um R instalado depois volte a ser usado sem reiniciar o processo.
+
+        Returns:
+            bool: True se a análise R está ativada e o R está disponível
+        """
+        if not self.r_enabled:
+            return False
+
+        if self._r_available is None or (
+                not self._r_available
+                and time.monotonic() - self._r_probe_time >= self.R_PROBE_INTERVAL):
+            self._r_available = is_r_available()
+            self._r_probe_time = time.monotonic()
+            if not self._r_available:
+                logger.warning("Rscript não encontrado; análise R desativada temporariamente")
+
+        return self._r_available
+
+    def _apply_r_analysis(self, culture_data: Dict[str, Any],
+                          r_analysis: Optional[Dict[str, Any]],
+                          formatted_stats: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """
+        Incorpora os resultados da análise R aos dados da cultura
+
+        Args:
+            culture_data (Dict[str, Any]): Dados da cultura a serem enriquecidos
+            r_analysis (Optional[Dict[str, Any]]): Resultado retornado pelo R
+            formatted_stats (Optional[Dict[str, Dict[str, Any]]], optional): Estatísticas
+                já formatadas em lote pelo chamador (ver _format_summary_stats_batch)
+
+        Returns:
+            None: Os resultados são adicionados diretamente ao dicionário de dados
+        """
+        if not r_analysis:
+            return
+
+        culture_data["analise_estatistica"] = r_analysis
+
+        # extrai e formatar estatísticas para uso no frontend
+        if "input_summary" in r_analysis:
+            # formata estatísticas para exibição
+            if formatted_stats is None:
+                formatted_stats = self._format_summary_stats(r_analysis["input_summary"])
+
+            if formatted_stats:
+                # adiciona explicações sobre as estatísticas
+                culture_data["estatisticas_formatadas"] = formatted_stats
+                culture_data["explicacoes_estatisticas"] = self._EXPLICACOES_ESTATISTICAS
+
+        
+        # processa análises estatísticas avançadas, se disponíveis
+        if "statistical_analysis" in r_analysis:
+            stat_analysis = r_analysis["statistical_analysis"]
+            
+            # extrai informações sobre outliers e tendências em uma única passada
+            outliers_info = {}
+            trends_info = {}
+            for key, value in stat_analysis.items():
+                if key.endswith("_outliers"):
+                    if "n_outliers" in value and value["n_outliers"] > 0:
+                        field = key.replace("_outliers", "")
+                        outliers_info[field] = {
+                            "quantidade": value["n_outliers"],
+                            "porcentagem": round(value.get("percentage", 0), 2),
+                            "valores": value.get("outliers", []),
+                            "metodo": value.get("method", "desconhecido")
+                        }
+                elif key.endswith("_trend"):
+                    if "trend" in value:
+                        field = key.replace("_trend", "")
+                        trends_info[field] = {
+                            "tendencia": value["trend"],
+                            "inclinacao": value.get("slope", "N/A"),
+                            "significancia": value.get("significance", "N/A"),
+                            "metodo": value.get("method", "análise simples")
+                        }
+            
+            if outliers_info:
+                culture_data["outliers_detectados"] = outliers_info
+            
+            if trends_info:
+                culture_data["analise_tendencia"] = trends_info
+
+
+    def _format_summary_stats(self, summary: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Formata as estatísticas resumidas retornadas pelo R para exibição
+
+        Args:
+            summary (Dict[str, Any]): Bloco "input_summary" da análise R
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Estatísticas detalhadas por campo
+        """
+        return self._format_summary_stats_batch([summary])[0]
+
+
+    def _format_summary_stats_batch(self, summaries: List[Dict[str, Any]]) -> List[Dict[str, Dict[str, Any]]]:
+        """
+        Formata as estatísticas resumidas de várias análises R de uma só vez
+
+        Os campos de todas as análises são reunidos em vetores únicos, de modo que
+        as métricas derivadas (coeficiente de variação, erro padrão e intervalo
+        de confiança) são calculadas em poucas operações NumPy para o lote inteiro.
+
+        Args:
+            summaries (List[Dict[str, Any]]): Blocos "input_summary" das análises R
+
+        Returns:
+            List[Dict[str, Dict[str, Any]]]: Estatísticas detalhadas por campo, na
+                mesma ordem das análises recebidas
+        """
+        # pares (índice da análise, campo) de todas as análises, em ordem
+        entries = [
+            (j, field, stats)
+            for j, summary in enumerate(summaries)
+            for field, stats in summary.items()
+            if isinstance(stats, dict) and "mean" in stats and "std_dev" in stats
+        ]
+        results = [{} for _ in summaries]
+        if not entries:
+            return results
+
+        stats_list = [stats for _, _, stats in entries]
+
+        # valores textuais (ex.: "NA" vindo do R) viram NaN nos vetores
+        def column(key: str, default: Any) -> np.ndarray:
+            values = [stats.get(key, default) for stats in stats_list]
+            return np.array([np.nan if isinstance(v, str) else v for v in values], dtype=float)
+
+        means = column("mean", np.nan)
+        stds = column("std_dev", np.nan)
+        ns = column("n", 0)
+        conf_lows = column("conf_low", np.nan)
+        conf_highs = column("conf_high", np.nan)
+
+        # calcula métricas derivadas de forma vetorizada, na mesma ordem de
+        # operações da versão escalar
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sqrt_ns = np.sqrt(ns)
+            std_errors = stds / sqrt_ns
+            margins = 1.96 * stds / sqrt_ns
+            cvs = stds / means * 100
+            ci_lows = np.where(np.isnan(conf_lows), means - margins, conf_lows)
+            ci_highs = np.where(np.isnan(conf_highs), means + margins, conf_highs)
+
+        # arredonda com round() do Python: np.round arredonda o decimal
+        # escalado (2.675 -> 2.68), enquanto round() usa o valor binário
+        # exato (2.675 -> 2.67), que é o resultado esperado
+        cvs = [round(value, 2) for value in cvs.tolist()]
+        rounded_errors = [round(value, 2) for value in std_errors.tolist()]
+        ci_lows = [round(value, 2) for value in ci_lows.tolist()]
+        ci_highs = [round(value, 2) for value in ci_highs.tolist()]
+
+        # máscaras de validade de cada métrica
+        has_mean_std = ~np.isnan(means) & ~np.isnan(stds)
+        has_n = ns > 0
+        cv_valid = (has_mean_std & (means != 0)).tolist()
+        error_valid = (~np.isnan(stds) & has_n).tolist()
+        ci_valid = (has_mean_std & has_n).tolist()
+
+        for i, (j, field, stats) in enumerate(entries):
+            mean = stats["mean"]
+            std_dev = stats["std_dev"]
+            minimo = stats.get("min", "N/A")
+            maximo = stats.get("max", "N/A")
+            has_range = "max" in stats and "min" in stats
+
+            # cria um dicionário com estatísticas mais detalhadas
+            results[j][field] = {
+                "media": mean if isinstance(mean, str) else round(mean, 2),
+                "desvio_padrao": std_dev if isinstance(std_dev, str) else round(std_dev, 2),
+                "coeficiente_variacao": cvs[i] if cv_valid[i] else "N/A",
+                "erro_padrao": rounded_errors[i] if error_valid[i] else "N/A",
+                "intervalo_confianca": [ci_lows[i], ci_highs[i]] if ci_valid[i] else ["N/A", "N/A"],
+                "minimo": minimo,
+                "maximo": maximo,
+                "amplitude": round(maximo - minimo, 2) if has_range else "N/A",
+                "mediana": stats.get("median", "N/A"),
+                "q1": stats.get("q1", "N/A"),
+                "q3": stats.get("q3", "N/A"),
+                "iqr": stats.get("iqr", "N/A"),
+                "tamanho_amostra": stats.get("n", 0)
+            }
+
+        return results
+
+
     def validate_sugarcane_parameters(self, area: float, espacamento: float, 
                                      ciclo: str, with_irrigation: bool) -> Dict[str, Any]:
         """
@@ -355,58 +693,240 @@ class CultureController:
         Returns:
             Dict[str, Any]: Recomendações e validações
         """
-        # normaliza ciclo para garantir consistência
-        ciclo = ciclo.lower() if ciclo else "médio"
+        # as chaves das recomendações já estão em minúsculas: só normaliza (e aloca
+        # uma nova string) quando o ciclo informado não é uma delas
+        recommendations = self.SUGARCANE_RECOMMENDATIONS
+        ciclo_rec = recommendations.get(ciclo)
+        if ciclo_rec is None:
+            ciclo = ciclo.lower() if ciclo else "médio"
+
+            # se ciclo não está nas recomendações, usar "médio" como padrão
+            if ciclo not in recommendations:
+                ciclo = "médio"
+            ciclo_rec = recommendations[ciclo]
         
-        # se ciclo não está nas recomendações, usar "médio" como padrão
-        if ciclo not in self.SUGARCANE_RECOMMENDATIONS:
-            ciclo = "médio"
-            
-        # obtém recomendações para o ciclo selecionado
-        ciclo_rec = self.SUGARCANE_RECOMMENDATIONS[ciclo]
+        # valida espaçamento e área
+        espacamento_status = self._range_status(espacamento, ciclo_rec["espacamento"], "adequado")
+        area_status = self._range_status(area, ciclo_rec["area"], "adequada")
+
+        # as mensagens dependem apenas das faixas, não dos valores exatos
+        espacamento_msg, area_msg, irrigacao_msg = self._sugarcane_messages(
+            ciclo, espacamento_status, area_status, bool(with_irrigation)
+        )
+
+        # partes estáticas das recomendações, montadas uma única vez por ciclo;
+        # são copiadas para que culturas diferentes não compartilhem dicionários
+        static = self._sugarcane_static(ciclo)
+
+        # juntar todas as recomendações
+        return {
+            "ciclo_info": dict(static["info"]),
+            "espacamento": {
+                "status": espacamento_status,
+                "mensagem": espacamento_msg,
+                "recomendado": dict(static["espacamento_recomendado"])
+            },
+            "area": {
+                "status": area_status,
+                "mensagem": area_msg,
+                "recomendado": dict(static["area_recomendado"])
+            },
+            "irrigacao": {
+                "ativa": with_irrigation,
+                "mensagem": irrigacao_msg,
+                **static["irrigacao"]
+            }
+        }
+
+
+    def validate_soybean_parameters(self, area: float, espacamento: float, 
+                                  variedade: str, with_irrigation: bool) -> Dict[str, Any]:
+        """
+        Valida os parâmetros para cultivo de soja e fornece recomendações
+
+        Args:
+            area (float): Área de plantio em hectares
+            espacamento (float): Espaçamento entre linhas em metros
+            variedade (str): Variedade de soja (convencional ou transgênica)
+            with_irrigation (bool): Se sistema de irrigação está ativado
+
+        Returns:
+            Dict[str, Any]: Recomendações e validações
+        """
+        # as chaves das recomendações já estão em minúsculas: só normaliza (e aloca
+        # uma nova string) quando a variedade informada não é uma delas
+        recommendations = self.SOYBEAN_RECOMMENDATIONS
+        variedade_rec = recommendations.get(variedade)
+        if variedade_rec is None:
+            variedade = variedade.lower() if variedade else "convencional"
+
+            # se variedade não está nas recomendações, usar "convencional" como padrão
+            if variedade not in recommendations:
+                variedade = "convencional"
+            variedade_rec = recommendations[variedade]
         
-        # valida espaçamento
-        espacamento_status = "adequado"
+        # valida espaçamento e área
+        espacamento_status = self._range_status(espacamento, variedade_rec["espacamento"], "adequado")
+        area_status = self._range_status(area, variedade_rec["area"], "adequada")
+
+        # as mensagens dependem apenas das faixas, não dos valores exatos
+        espacamento_msg, area_msg, irrigacao_msg = self._soybean_messages(
+            variedade, espacamento_status, area_status, bool(with_irrigation)
+        )
+
+        # partes estáticas das recomendações, montadas uma única vez por variedade;
+        # são copiadas para que culturas diferentes não compartilhem dicionários
+        static = self._soybean_static(variedade)
+
+        # junta todas as recomendações
+        return {
+            "variedade_info": dict(static["info"]),
+            "espacamento": {
+                "status": espacamento_status,
+                "mensagem": espacamento_msg,
+                "recomendado": dict(static["espacamento_recomendado"])
+            },
+            "area": {
+                "status": area_status,
+                "mensagem": area_msg,
+                "recomendado": dict(static["area_recomendado"])
+            },
+            "irrigacao": {
+                "ativa": with_irrigation,
+                "mensagem": irrigacao_msg,
+                **static["irrigacao"]
+            }
+        }
+
+
+    @staticmethod
+    def _range_status(value: float, limits: Dict[str, Any], within: str) -> str:
+        """
+        Classifica um valor em relação à faixa recomendada
+
+        Args:
+            value (float): Valor informado
+            limits (Dict[str, Any]): Faixa recomendada com "min" e "max" (max pode ser None)
+            within (str): Status a retornar quando o valor está dentro da faixa
+
+        Returns:
+            str: "abaixo", "acima" ou o status informado em within
+        """
+        maximo = limits["max"]
+        if value < limits["min"]:
+            return "abaixo"
+        if maximo and value > maximo:
+            return "acima"
+        return within
+
+
+    @staticmethod
+    def _build_static_subtrees(rec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extrai as partes das recomendações que não dependem dos parâmetros informados
+
+        Args:
+            rec (Dict[str, Any]): Recomendações de um ciclo ou variedade
+
+        Returns:
+            Dict[str, Any]: Sub-dicionários de duração, faixas recomendadas e irrigação
+        """
+        duracao_rec = rec["duracao"]
+        espacamento_rec = rec["espacamento"]
+        area_rec = rec["area"]
+        irrigacao_rec = rec["irrigacao"]
+
+        return {
+            "info": {
+                "duracao": duracao_rec["meses"] + " meses",
+                "descricao": duracao_rec["description"]
+            },
+            "espacamento_recomendado": {
+                "min": espacamento_rec["min"],
+                "max": espacamento_rec["max"],
+                "ideal": espacamento_rec["ideal"]
+            },
+            "area_recomendado": {
+                "min": area_rec["min"],
+                "max": area_rec["max"],
+                "ideal": area_rec["ideal"]
+            },
+            "irrigacao": {
+                "sistema": irrigacao_rec["sistema"],
+                "frequencia": irrigacao_rec["frequencia"],
+                "volume": irrigacao_rec["volume"],
+                "eficiencia": irrigacao_rec["eficiencia"]
+            }
+        }
+
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _sugarcane_static(cls, ciclo: str) -> Dict[str, Any]:
+        """
+        Partes estáticas das recomendações da cana-de-açúcar (memoizado; somente leitura)
+
+        Returns:
+            Dict[str, Any]: Sub-dicionários-modelo, copiados a cada validação
+        """
+        return cls._build_static_subtrees(cls.SUGARCANE_RECOMMENDATIONS[ciclo])
+
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _soybean_static(cls, variedade: str) -> Dict[str, Any]:
+        """
+        Partes estáticas das recomendações da soja (memoizado; somente leitura)
+
+        Returns:
+            Dict[str, Any]: Sub-dicionários-modelo, copiados a cada validação
+        """
+        return cls._build_static_subtrees(cls.SOYBEAN_RECOMMENDATIONS[variedade])
+
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _sugarcane_messages(cls, ciclo: str, espacamento_status: str, area_status: str,
+                            with_irrigation: bool) -> Tuple[str, str, str]:
+        """
+        Monta as mensagens de validação da cana-de-açúcar (memoizado)
+
+        Returns:
+            Tuple[str, str, str]: Mensagens de espaçamento, área e irrigação
+        """
+        ciclo_rec = cls.SUGARCANE_RECOMMENDATIONS[ciclo]
+        espacamento_rec = ciclo_rec["espacamento"]
+        area_rec = ciclo_rec["area"]
+
         espacamento_msg = "O espaçamento está dentro do intervalo recomendado."
-        
-        if espacamento < ciclo_rec["espacamento"]["min"]:
-            espacamento_status = "abaixo"
+        if espacamento_status == "abaixo":
             espacamento_msg = (
                 f"O espaçamento está abaixo do mínimo recomendado "
-                f"({ciclo_rec['espacamento']['min']} m) para o ciclo {ciclo}. "
+                f"({espacamento_rec['min']} m) para o ciclo {ciclo}. "
                 f"Espaçamento muito pequeno pode dificultar a mecanização e reduzir a produtividade."
             )
-        elif espacamento > ciclo_rec["espacamento"]["max"]:
-            espacamento_status = "acima"
+        elif espacamento_status == "acima":
             espacamento_msg = (
                 f"O espaçamento está acima do máximo recomendado "
-                f"({ciclo_rec['espacamento']['max']} m) para o ciclo {ciclo}. "
+                f"({espacamento_rec['max']} m) para o ciclo {ciclo}. "
                 f"Espaçamento muito grande pode reduzir o aproveitamento da área."
             )
-        
-        # valida área
-        area_status = "adequada"
+
         area_msg = "A área está dentro do intervalo recomendado."
-        
-        if area < ciclo_rec["area"]["min"]:
-            area_status = "abaixo"
+        if area_status == "abaixo":
             area_msg = (
                 f"A área está abaixo do mínimo recomendado "
-                f"({ciclo_rec['area']['min']} ha) para o ciclo {ciclo}. "
-                f"{ciclo_rec['area']['description']}"
+                f"({area_rec['min']} ha) para o ciclo {ciclo}. "
+                f"{area_rec['description']}"
             )
-        elif ciclo_rec["area"]["max"] and area > ciclo_rec["area"]["max"]:
-            area_status = "acima"
+        elif area_status == "acima":
             area_msg = (
                 f"A área está acima do máximo recomendado "
-                f"({ciclo_rec['area']['max']} ha) para o ciclo {ciclo}. "
+                f"({area_rec['max']} ha) para o ciclo {ciclo}. "
                 f"Considere se tem recursos suficientes para manejo adequado."
             )
-        
-        # recomendações para irrigação
+
         irrigacao_rec = ciclo_rec["irrigacao"]
-        irrigacao_msg = ""
-        
         if with_irrigation:
             irrigacao_msg = (
                 f"Sistema de irrigação recomendado: {irrigacao_rec['sistema']}. "
@@ -420,108 +940,53 @@ class CultureController:
                 f"Sistema ideal: {irrigacao_rec['sistema']}. "
                 f"Sem irrigação, a produtividade pode ser significativamente reduzida."
             )
-        
-        # juntar todas as recomendações
-        return {
-            "ciclo_info": {
-                "duracao": ciclo_rec["duracao"]["meses"] + " meses",
-                "descricao": ciclo_rec["duracao"]["description"]
-            },
-            "espacamento": {
-                "status": espacamento_status,
-                "mensagem": espacamento_msg,
-                "recomendado": {
-                    "min": ciclo_rec["espacamento"]["min"],
-                    "max": ciclo_rec["espacamento"]["max"],
-                    "ideal": ciclo_rec["espacamento"]["ideal"]
-                }
-            },
-            "area": {
-                "status": area_status,
-                "mensagem": area_msg,
-                "recomendado": {
-                    "min": ciclo_rec["area"]["min"],
-                    "max": ciclo_rec["area"]["max"],
-                    "ideal": ciclo_rec["area"]["ideal"]
-                }
-            },
-            "irrigacao": {
-                "ativa": with_irrigation,
-                "mensagem": irrigacao_msg,
-                "sistema": irrigacao_rec["sistema"],
-                "frequencia": irrigacao_rec["frequencia"],
-                "volume": irrigacao_rec["volume"],
-                "eficiencia": irrigacao_rec["eficiencia"]
-            }
-        }
 
+        return espacamento_msg, area_msg, irrigacao_msg
 
-    def validate_soybean_parameters(self, area: float, espacamento: float, 
-                                  variedade: str, with_irrigation: bool) -> Dict[str, Any]:
-        """
-        Valida os parâmetros para cultivo de soja e fornece recomendações
 
-        Args:
-            area (float): Área de plantio em hectares
-            espacamento (float): Espaçamento entre linhas em metros
-            variedade (str): Variedade de soja (convencional ou transgênica)
-            with_irrigation (bool): Se sistema de irrigação está ativado
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _soybean_messages(cls, variedade: str, espacamento_status: str, area_status: str,
+                          with_irrigation: bool) -> Tuple[str, str, str]:
+        """
+        Monta as mensagens de validação da soja (memoizado)
 
         Returns:
-            Dict[str, Any]: Recomendações e validações
+            Tuple[str, str, str]: Mensagens de espaçamento, área e irrigação
         """
-        # normaliza variedade para garantir consistência
-        variedade = variedade.lower() if variedade else "convencional"
-        
-        # se variedade não está nas recomendações, usar "convencional" como padrão
-        if variedade not in self.SOYBEAN_RECOMMENDATIONS:
-            variedade = "convencional"
-            
-        # obtém recomendações para a variedade selecionada
-        variedade_rec = self.SOYBEAN_RECOMMENDATIONS[variedade]
-        
-        # valida espaçamento
-        espacamento_status = "adequado"
+        variedade_rec = cls.SOYBEAN_RECOMMENDATIONS[variedade]
+        espacamento_rec = variedade_rec["espacamento"]
+        area_rec = variedade_rec["area"]
+
         espacamento_msg = "O espaçamento está dentro do intervalo recomendado."
-        
-        if espacamento < variedade_rec["espacamento"]["min"]:
-            espacamento_status = "abaixo"
+        if espacamento_status == "abaixo":
             espacamento_msg = (
                 f"O espaçamento está abaixo do mínimo recomendado "
-                f"({variedade_rec['espacamento']['min']} m) para soja {variedade}. "
+                f"({espacamento_rec['min']} m) para soja {variedade}. "
                 f"Espaçamento muito pequeno pode dificultar o desenvolvimento das plantas."
             )
-        elif espacamento > variedade_rec["espacamento"]["max"]:
-            espacamento_status = "acima"
+        elif espacamento_status == "acima":
             espacamento_msg = (
                 f"O espaçamento está acima do máximo recomendado "
-                f"({variedade_rec['espacamento']['max']} m) para soja {variedade}. "
+                f"({espacamento_rec['max']} m) para soja {variedade}. "
                 f"Espaçamento muito grande pode reduzir a produtividade."
             )
-        
-        # valida área
-        area_status = "adequada"
+
         area_msg = "A área está dentro do intervalo recomendado."
-        
-        if area < variedade_rec["area"]["min"]:
-            area_status = "abaixo"
+        if area_status == "abaixo":
             area_msg = (
                 f"A área está abaixo do mínimo recomendado "
-                f"({variedade_rec['area']['min']} ha) para soja {variedade}. "
-                f"{variedade_rec['area']['description']}"
+                f"({area_rec['min']} ha) para soja {variedade}. "
+                f"{area_rec['description']}"
             )
-        elif variedade_rec["area"]["max"] and area > variedade_rec["area"]["max"]:
-            area_status = "acima"
+        elif area_status == "acima":
             area_msg = (
                 f"A área está acima do máximo recomendado "
-                f"({variedade_rec['area']['max']} ha) para soja {variedade}. "
+                f"({area_rec['max']} ha) para soja {variedade}. "
                 f"Considere se tem recursos suficientes para manejo adequado."
             )
-        
-        # recomendações para irrigação
+
         irrigacao_rec = variedade_rec["irrigacao"]
-        irrigacao_msg = ""
-        
         if with_irrigation:
             irrigacao_msg = (
                 f"Sistema de irrigação recomendado: {irrigacao_rec['sistema']}. "
@@ -535,40 +1000,8 @@ class CultureController:
                 f"Sistema ideal: {irrigacao_rec['sistema']}. "
                 f"Sem irrigação, a produtividade pode ser reduzida em períodos de estiagem."
             )
-        
-        # junta todas as recomendações
-        return {
-            "variedade_info": {
-                "duracao": variedade_rec["duracao"]["meses"] + " meses",
-                "descricao": variedade_rec["duracao"]["description"]
-            },
-            "espacamento": {
-                "status": espacamento_status,
-                "mensagem": espacamento_msg,
-                "recomendado": {
-                    "min": variedade_rec["espacamento"]["min"],
-                    "max": variedade_rec["espacamento"]["max"],
-                    "ideal": variedade_rec["espacamento"]["ideal"]
-                }
-            },
-            "area": {
-                "status": area_status,
-                "mensagem": area_msg,
-                "recomendado": {
-                    "min": variedade_rec["area"]["min"],
-                    "max": variedade_rec["area"]["max"],
-                    "ideal": variedade_rec["area"]["ideal"]
-                }
-            },
-            "irrigacao": {
-                "ativa": with_irrigation,
-                "mensagem": irrigacao_msg,
-                "sistema": irrigacao_rec["sistema"],
-                "frequencia": irrigacao_rec["frequencia"],
-                "volume": irrigacao_rec["volume"],
-                "eficiencia": irrigacao_rec["eficiencia"]
-            }
-        }
+
+        return espacamento_msg, area_msg, irrigacao_msg
 
 
     def calculate_lines(self, culture_id: int, culture_data: Dict[str, Any]) -> int:
@@ -589,7 +1022,7 @@ class CultureController:
         if espacamento <= 0:
             raise ValueError("Espaçamento inválido. Deve ser maior que zero.")
 
-        return self.calculate_lines_by_strategy(strategy, area, espacamento)
+        return self._calculate_lines_unchecked(strategy, area, espacamento)
 
     def calculate_lines_by_strategy(self, strategy: str, area: float, espacamento: float) -> int:
         """
@@ -603,17 +1036,38 @@ class CultureController:
         Returns:
             int: Número de linhas calculado
         """
-        if strategy not in self.calculation_strategies:
-            logger.warning(f"Estratégia '{strategy}' não encontrada. Usando estratégia padrão 'quadrado'.")
-            strategy = "quadrado"
-
         if espacamento <= 0:
-            logger.warning(f"Espaçamento inválido: {espacamento}. Usando valor padrão de 1.0")
+            logger.warning("Espaçamento inválido: %s. Usando valor padrão de 1.0", espacamento)
             espacamento = 1.0
 
+        return self._calculate_lines_unchecked(strategy, area, espacamento)
+
+    def _calculate_lines_unchecked(self, strategy: str, area: float, espacamento: float) -> int:
+        """
+        Calcula o número de linhas sem validar o espaçamento (espacamento > 0 já garantido)
+
+        Args:
+            strategy (str): Nome da estratégia de cálculo
+            area (float): Área em hectares
+            espacamento (float): Espaçamento entre linhas em metros, maior que zero
+
+        Returns:
+            int: Número de linhas calculado
+        """
+        # caminho direto para as estratégias nativas, sem consultar o registro
+        if strategy == "quadrado":
+            return self._calculate_square_strategy(area, espacamento)
+        if strategy == "retangular":
+            return self._calculate_rectangular_strategy(area, espacamento)
+
+        if strategy not in self.calculation_strategies:
+            logger.warning("Estratégia '%s' não encontrada. Usando estratégia padrão 'quadrado'.", strategy)
+            return self._calculate_square_strategy(area, espacamento)
+
         return self.calculation_strategies[strategy](area, espacamento)
 
-    def _calculate_square_strategy(self, area: float, espacamento: float) -> int:
+    @staticmethod
+    def _calculate_square_strategy(area: float, espacamento: float) -> int:
         """
         Estratégia de cálculo para área quadrada
 
@@ -633,6 +1087,72 @@ class CultureController:
         # calcula o número de linhas
         return int(lado / espacamento)
 
+    def calculate_lines_batch(self, strategy: str, areas: np.ndarray, espacamentos: np.ndarray) -> np.ndarray:
+        """
+        Calcula o número de linhas de várias culturas de uma só vez
+
+        Args:
+            strategy (str): Nome da estratégia de cálculo
+            areas (np.ndarray): Áreas em hectares
+            espacamentos (np.ndarray): Espaçamentos entre linhas em metros
+
+        Returns:
+            np.ndarray: Número de linhas calculado para cada cultura
+        """
+        if strategy not in self.calculation_strategies:
+            logger.warning("Estratégia '%s' não encontrada. Usando estratégia padrão 'quadrado'.", strategy)
+            strategy = "quadrado"
+
+        areas = np.asarray(areas, dtype=float)
+        espacamentos = np.asarray(espacamentos, dtype=float)
+
+        # mesmo tratamento de espaçamento inválido da versão escalar
+        invalid = espacamentos <= 0
+        if invalid.any():
+            logger.warning("Espaçamento inválido em %d culturas. Usando valor padrão de 1.0", int(invalid.sum()))
+            espacamentos = np.where(invalid, 1.0, espacamentos)
+
+        batch_strategy = self.batch_calculation_strategies.get(strategy)
+        if batch_strategy is not None:
+            return batch_strategy(areas, espacamentos)
+
+        # estratégia sem versão vetorizada: aplica a versão escalar item a item
+        scalar_strategy = self.calculation_strategies[strategy]
+        return np.array([
+            scalar_strategy(area, espacamento)
+            for area, espacamento in zip(areas.tolist(), espacamentos.tolist())
+        ], dtype=np.int64)
+
+    def _calculate_square_strategy_batch(self, areas: np.ndarray, espacamentos: np.ndarray) -> np.ndarray:
+        """
+        Estratégia de cálculo para área quadrada (vetorizada)
+
+        Args:
+            areas (np.ndarray): Áreas em hectares
+            espacamentos (np.ndarray): Espaçamentos entre linhas em metros
+
+        Returns:
+            np.ndarray: Número de linhas calculado para cada cultura
+        """
+        # lado do quadrado em metros dividido pelo espaçamento, truncado como int()
+        return (np.sqrt(areas * 10000) / espacamentos).astype(np.int64)
+
+    def _calculate_rectangular_strategy_batch(self, areas: np.ndarray, espacamentos: np.ndarray,
+                                              proporcao: float = 1.5) -> np.ndarray:
+        """
+        Estratégia de cálculo para área retangular (vetorizada)
+
+        Args:
+            areas (np.ndarray): Áreas em hectares
+            espacamentos (np.ndarray): Espaçamentos entre linhas em metros
+            proporcao (float, optional): Proporção comprimento/largura do retângulo
+
+        Returns:
+            np.ndarray: Número de linhas calculado para cada cultura
+        """
+        # largura do retângulo (sqrt(A / p)) dividida pelo espaçamento, truncada como int()
+        return (np.sqrt(areas * 10000 / proporcao) / espacamentos).astype(np.int64)
+
 
     def generate_random_cultures(self, culture_type: int, num_samples: int = 10, 
                                with_statistics: bool = True) -> Dict[str, Any]:
@@ -647,80 +1167,116 @@ class CultureController:
         Returns:
             Dict[str, Any]: Dados gerados e estatísticas
         """
-        import random
-        import math
-        import numpy as np
-        from datetime import datetime, timedelta
-
-        if num_samples <= 0:
-            raise ValueError("Número de amostras deve ser maior que zero")
-
-        # valida tipo de cultura
-        if culture_type not in [1, 2]:
-            raise ValueError(f"Tipo de cultura inválido: {culture_type}")
-
-        # configura limites com base no tipo de cultura
-        if culture_type == 1:  # Soja
-            variedades = ["convencional", "transgênica"]
-            area_min, area_max = 5, 100
-            espacamento_min, espacamento_max = 0.4, 0.6
-            params_name = "variedade"
-        else:  # Cana-de-Açúcar
-            ciclos = ["curto", "médio", "longo"]
-            area_min, area_max = 5, 50
-            espacamento_min, espacamento_max = 1.4, 1.8
-            params_name = "ciclo"
+        samples = self._draw_random_parameters(culture_type, num_samples)
+        param_options = samples["param_options"]
+
+        areas = samples["areas"].tolist()
+        espacamentos = samples["espacamentos"].tolist()
+        irrigations = samples["irrigacoes"].tolist()
+        specific_params = [param_options[k] for k in samples["parametro_ids"].tolist()]
+
+        # calcula o número de linhas e os insumos de todas as amostras de uma vez
+        linhas_array = self.calculate_lines_batch(samples["strategy"], samples["areas"], samples["espacamentos"])
+        linhas = linhas_array.tolist()
+        dosagens = self.INPUT_DOSAGES[culture_type]
+        insumos = self._calculate_inputs_batch(
+            samples["areas"], samples["espacamentos"], linhas_array,
+            dosagens["dosagem_herbicida"], dosagens["dosagem_fertilizante"]
+        )
+        quantidades_herbicida = insumos["quantidade_herbicida"].tolist()
+        quantidades_fertilizante = insumos["quantidade_fertilizante"].tolist()
+        comprimentos = insumos["comprimento_linha"].tolist()
+        metros_lineares = insumos["metros_lineares_total"].tolist()
+        com_comprimento = (~np.isnan(insumos["comprimento_linha"])).tolist()
+
+        type_label = self.CULTURE_TYPE_LABELS[culture_type]
+        id_prefix = type_label.lower()
+        param_name = self._CULTURE_SPECS[culture_type]["param"]
+
+        # datas de plantio (meia-noite de hoje menos os dias sorteados), formatadas
+        # em ISO de uma só vez
+        today = np.datetime64(datetime.now().date(), "D")
+        datas_plantio = (
+            (today - samples["dias_plantio"].astype("timedelta64[D]")).astype("datetime64[s]").astype(str).tolist()
+        )
+
+        # gera culturas aleatórias (lista pré-dimensionada)
+        cultures = [None] * num_samples
+        for i, (area, espacamento, with_irrigation, specific_param, num_linhas) in enumerate(
+            zip(areas, espacamentos, irrigations, specific_params, linhas)
+        ):
+            # insumos já calculados em lote (comprimento só existe quando há linhas)
+            insumos_cultura = {
+                "quantidade_herbicida": quantidades_herbicida[i],
+                "quantidade_fertilizante": quantidades_fertilizante[i]
+            }
+            if com_comprimento[i]:
+                insumos_cultura["comprimento_linha"] = comprimentos[i]
+                insumos_cultura["metros_lineares_total"] = metros_lineares[i]
 
-        # gera culturas aleatórias
-        cultures = []
-        for i in range(num_samples):
-            # gera área aleatória com distribuição log-normal (mais realista)
-            area = round(random.lognormvariate(0, 0.5) * (area_max - area_min) / 3 + area_min, 2)
-            
-            # gera espaçamento aleatório
-            espacamento = round(random.uniform(espacamento_min, espacamento_max), 2)
-            
-            # decide sobre irrigação (30% de chance)
-            with_irrigation = random.random() < 0.3
-            
-            # parâmetros específicos por tipo
-            if culture_type == 1:  # Soja
-                specific_param = random.choice(variedades)
-            else:  # Cana-de-Açúcar
-                specific_param = random.choice(ciclos)
-            
-            # cria cultura
-            kwargs = {params_name: specific_param}
+            # cria cultura passando o parâmetro específico (variedade ou ciclo) diretamente
             culture = self.create_culture(
-                culture_type=culture_type,
-                area=area,
-                espacamento=espacamento,
-                with_irrigation=with_irrigation,
-                **kwargs
+                culture_type, area, espacamento, with_irrigation,
+                _defer_r_analysis=True, _linhas_calculadas=num_linhas,
+                _insumos_calculados=insumos_cultura, **{param_name: specific_param}
             )
             
             # adiciona ID para rastreabilidade
-            culture['id'] = f"{culture['tipo'].lower()}_{i+1}"
+            culture['id'] = f"{id_prefix}_{i+1}"
             
             # adiciona data aleatória de plantio (nos últimos 6 meses)
-            days_ago = random.randint(0, 180)
-            culture['data_plantio'] = (datetime.now().replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) - timedelta(days=days_ago)).isoformat() 
+            culture['data_plantio'] = datas_plantio[i]
  
-            cultures.append(culture)
-
-        # calcula estatísticas se solicitado
+            cultures[i] = culture
+
+        # envia todas as amostras ao R em uma única chamada e
+        # associa cada análise à cultura de mesmo índice
+        if self._r_analysis_enabled():
+            try:
+                r_analyses = send_to_r_for_analysis_bulk(cultures, session=self._r_conn)
+                if r_analyses:
+                    # formata as estatísticas de todas as amostras em um único passe
+                    with_summary = [
+                        i for i, r_analysis in enumerate(r_analyses)
+                        if r_analysis and "input_summary" in r_analysis
+                    ]
+                    formatted = [None] * len(r_analyses)
+                    batch = self._format_summary_stats_batch(
+                        [r_analyses[i]["input_summary"] for i in with_summary]
+                    )
+                    for i, formatted_stats in zip(with_summary, batch):
+                        formatted[i] = formatted_stats
+
+                    for culture, r_analysis, formatted_stats in zip(cultures, r_analyses, formatted):
+                        self._apply_r_analysis(culture, r_analysis, formatted_stats)
+            except Exception as e:
+                logger.warning("Não foi possível obter análise R em lote: %s", e)
+
+        # calcula estatísticas se solicitado, direto sobre os arrays já sorteados
         statistics = None
         if with_statistics:
-            statistics = self._calculate_statistics_for_cultures(cultures)
+            columns = {
+                "area": samples["areas"],
+                "espacamento": samples["espacamentos"],
+                "linhas_calculadas": linhas_array,
+                "quantidade_herbicida": insumos["quantidade_herbicida"],
+                "quantidade_fertilizante": insumos["quantidade_fertilizante"],
+                "irrigacao": samples["irrigacoes"],
+                self._CATEGORY_FIELDS[type_label]: specific_params
+            }
+            # metros lineares só existem nas culturas com linhas
+            if any(com_comprimento):
+                columns["metros_lineares_total"] = np.where(
+                    com_comprimento, insumos["metros_lineares_total"], 0.0
+                )
+            statistics = self._calculate_statistics_for_cultures(cultures, type_label, columns)
         
         # resultado
         result = {
             "status": "success",
             "count": len(cultures),
             "cultures": cultures,
-            "culture_type": "Soja" if culture_type == 1 else "Cana-de-Açúcar"
+            "culture_type": type_label
         }
         
         if statistics:
@@ -729,92 +1285,218 @@ class CultureController:
         return result
 
 
-    def _calculate_statistics_for_cultures(self, cultures: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _draw_random_parameters(self, culture_type: int, num_samples: int) -> Dict[str, Any]:
+        """
+        Sorteia os parâmetros das culturas aleatórias de uma só vez (vetorizado)
+
+        Args:
+            culture_type (int): Tipo de cultura (1=Soja, 2=Cana-de-Açúcar)
+            num_samples (int): Número de amostras a serem geradas
+
+        Returns:
+            Dict[str, Any]: Estratégia, opções de variedade/ciclo e arrays sorteados
+        """
+        if num_samples <= 0:
+            raise ValueError("Número de amostras deve ser maior que zero")
+
+        # valida tipo de cultura
+        if culture_type not in [1, 2]:
+            raise ValueError(f"Tipo de cultura inválido: {culture_type}")
+
+        # configura limites com base no tipo de cultura
+        if culture_type == 1:  # Soja
+            param_options = ["convencional", "transgênica"]
+            strategy = "quadrado"
+            area_min, area_max = 5, 100
+            espacamento_min, espacamento_max = 0.4, 0.6
+        else:  # Cana-de-Açúcar
+            param_options = ["curto", "médio", "longo"]
+            strategy = "retangular"
+            area_min, area_max = 5, 50
+            espacamento_min, espacamento_max = 1.4, 1.8
+
+        rng = np.random.default_rng()
+
+        return {
+            "strategy": strategy,
+            "param_options": param_options,
+            # área com distribuição log-normal (mais realista)
+            "areas": np.round(
+                rng.lognormal(0, 0.5, num_samples) * (area_max - area_min) / 3 + area_min, 2
+            ),
+            "espacamentos": np.round(rng.uniform(espacamento_min, espacamento_max, num_samples), 2),
+            # irrigação com 30% de chance
+            "irrigacoes": rng.random(num_samples) < 0.3,
+            "parametro_ids": rng.choice(len(param_options), num_samples),
+            # dias desde o plantio (nos últimos 6 meses)
+            "dias_plantio": rng.integers(0, 181, num_samples)
+        }
+
+
+    def generate_random_cultures_array(self, culture_type: int, num_samples: int = 10) -> Dict[str, Any]:
+        """
+        Gera culturas aleatórias como array estruturado NumPy (uma linha por cultura)
+
+        Alternativa compacta a generate_random_cultures para quem precisa apenas
+        dos campos numéricos: não monta dicionários, recomendações nem análise R.
+        Campos não aplicáveis ficam com NaN (comprimento_linha e
+        metros_lineares_total sem linhas) ou 0 (consumo_agua sem irrigação).
+
+        Args:
+            culture_type (int): Tipo de cultura (1=Soja, 2=Cana-de-Açúcar)
+            num_samples (int): Número de amostras a serem geradas
+
+        Returns:
+            Dict[str, Any]: Array estruturado em "data" (RANDOM_CULTURE_DTYPE) e a
+                tabela de variedades/ciclos referenciada por "parametro_id"
+        """
+        samples = self._draw_random_parameters(culture_type, num_samples)
+        areas = samples["areas"]
+        espacamentos = samples["espacamentos"]
+        irrigacoes = samples["irrigacoes"]
+        dosagens = self.INPUT_DOSAGES[culture_type]
+
+        data = np.zeros(num_samples, dtype=self.RANDOM_CULTURE_DTYPE)
+        data["area"] = areas
+        data["espacamento"] = espacamentos
+        data["irrigacao"] = irrigacoes
+        data["parametro_id"] = samples["parametro_ids"]
+        data["linhas_calculadas"] = self.calculate_lines_batch(samples["strategy"], areas, espacamentos)
+        data["dosagem_herbicida"] = dosagens["dosagem_herbicida"]
+        data["dosagem_fertilizante"] = dosagens["dosagem_fertilizante"]
+
+        insumos = self._calculate_inputs_batch(
+            areas, espacamentos, data["linhas_calculadas"],
+            dosagens["dosagem_herbicida"], dosagens["dosagem_fertilizante"]
+        )
+        for field, values in insumos.items():
+            data[field] = values
+
+        # consumo de água apenas para culturas irrigadas (0.8 L/m²)
+        data["consumo_agua"] = np.where(irrigacoes, areas * 10000 * 0.8, 0.0)
+
+        return {
+            "status": "success",
+            "count": num_samples,
+            "culture_type": self.CULTURE_TYPE_LABELS[culture_type],
+            "param_name": "variedade" if culture_type == 1 else "ciclo",
+            "param_options": samples["param_options"],
+            "data": data
+        }
+
+
+    def _culture_columns(self, cultures: List[Dict[str, Any]],
+                         category_field: Optional[str]) -> Dict[str, Any]:
+        """
+        Converte a lista de culturas em colunas (uma sequência por campo)
+
+        Args:
+            cultures (List[Dict[str, Any]]): Lista de culturas
+            category_field (Optional[str]): Campo categórico (variedade/ciclo), se houver
+
+        Returns:
+            Dict[str, Any]: Arrays float64 dos campos numéricos presentes, array
+                booleano "irrigacao" e lista do campo categórico
+        """
+        n = len(cultures)
+
+        # campos calculados entram se estiverem presentes em alguma cultura
+        present_fields = set().union(*cultures)
+        numeric_fields = ["area", "espacamento"] + [
+            field for field in self._CALCULATED_NUMERIC_FIELDS if field in present_fields
+        ]
+
+        columns = {
+            field: np.fromiter((culture.get(field, 0) for culture in cultures), dtype=np.float64, count=n)
+            for field in numeric_fields
+        }
+
+        # coleta categorias e irrigação em uma única passada
+        categories = [None] * n
+        irrigations = np.zeros(n, dtype=bool)
+        for i, culture in enumerate(cultures):
+            categories[i] = culture.get(category_field)
+            irrigations[i] = bool(culture.get("irrigacao", False))
+
+        columns["irrigacao"] = irrigations
+        if category_field:
+            columns[category_field] = categories
+        return columns
+
+
+    def _calculate_statistics_for_cultures(self, cultures: List[Dict[str, Any]],
+                                           culture_type: Optional[str] = None,
+                                           columns: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Calcula estatísticas para um conjunto de culturas
         
         Args:
             cultures (List[Dict[str, Any]]): Lista de culturas para análise
+            culture_type (Optional[str], optional): Tipo das culturas ("Soja" ou
+                "Cana-de-Açúcar"); se omitido, usa o tipo da primeira cultura
+            columns (Optional[Dict[str, Any]], optional): Dados das culturas já em
+                colunas (ver _culture_columns); se omitido, são extraídos de cultures
                 
         Returns:
             Dict[str, Any]: Estatísticas calculadas
         """
-        import numpy as np
-        from collections import Counter
-        
         if not cultures or len(cultures) == 0:
             return {"error": "Nenhuma cultura disponível para análise"}
-        
-        # extrai campos numéricos para análise estatística
-        numeric_fields = ["area", "espacamento"]
-        
-        # adiciona campos calculados se disponíveis
-        for culture in cultures:
-            if "linhas_calculadas" in culture:
-                if "linhas_calculadas" not in numeric_fields:
-                    numeric_fields.append("linhas_calculadas")
-            if "quantidade_herbicida" in culture:
-                if "quantidade_herbicida" not in numeric_fields:
-                    numeric_fields.append("quantidade_herbicida")
-            if "quantidade_fertilizante" in culture:
-                if "quantidade_fertilizante" not in numeric_fields:
-                    numeric_fields.append("quantidade_fertilizante")
-            if "metros_lineares_total" in culture:
-                if "metros_lineares_total" not in numeric_fields:
-                    numeric_fields.append("metros_lineares_total")
+
+        # verifica tipo de cultura para determinar campos categóricos
+        if culture_type is None:
+            culture_type = cultures[0].get("tipo")
+        category_field = self._CATEGORY_FIELDS.get(culture_type)
+
+        # trabalha sobre colunas contíguas em vez da lista de dicionários
+        if columns is None:
+            columns = self._culture_columns(cultures, category_field)
+        numeric_fields = [
+            field for field in ("area", "espacamento") + self._CALCULATED_NUMERIC_FIELDS
+            if field in columns
+        ]
         
         # estatísticas para campos numéricos
         numeric_stats = {}
+        n = len(cultures)
         for field in numeric_fields:
-            values = [culture.get(field, 0) for culture in cultures]
-            if any(values):  # Se houver pelo menos um valor não-zero
+            values = columns[field]
+            if values.any():  # Se houver pelo menos um valor não-zero
+                mean = float(values.mean())
+                # variância a partir da média já calculada (mesma fórmula de np.var)
+                deviations = values - mean
+                variance = float((deviations * deviations).sum() / n)
+                std_dev = math.sqrt(variance)
+                min_value = float(values.min())
+                max_value = float(values.max())
+                q1, median, q3 = (float(q) for q in np.percentile(values, [25, 50, 75]))
+
                 # calcula estatísticas detalhadas
                 numeric_stats[field] = {
-                    "mean": float(np.mean(values)),
-                    "median": float(np.median(values)),
-                    "std_dev": float(np.std(values)),
-                    "variance": float(np.var(values)),  # Adicionando a variância
-                    "std_error": float(np.std(values)/np.sqrt(len(values))),  # Adicionando erro padrão
-                    "coefficient_of_variation": float(np.std(values)/np.mean(values)*100) if np.mean(values) != 0 else 0,  # Coeficiente de variação em %
-                    "min": float(np.min(values)),
-                    "max": float(np.max(values)),
-                    "range": float(np.max(values) - np.min(values)),  # Adicionando range (amplitude)
-                    "q1": float(np.percentile(values, 25)),
-                    "q3": float(np.percentile(values, 75)),
-                    "iqr": float(np.percentile(values, 75) - np.percentile(values, 25)),  # Adicionando intervalo interquartil
-                    "count": len(values),
+                    "mean": mean,
+                    "median": median,
+                    "std_dev": std_dev,
+                    "variance": variance,  # Adicionando a variância
+                    "std_error": std_dev / math.sqrt(n),  # Adicionando erro padrão
+                    "coefficient_of_variation": std_dev / mean * 100 if mean != 0 else 0,  # Coeficiente de variação em %
+                    "min": min_value,
+                    "max": max_value,
+                    "range": max_value - min_value,  # Adicionando range (amplitude)
+                    "q1": q1,
+                    "q3": q3,
+                    "iqr": q3 - q1,  # Adicionando intervalo interquartil
+                    "count": n,
                     # adiciona descrições claras para cada estatística
-                    "descriptions": {
-                        "mean": "Média aritmética dos valores",
-                        "median": "Valor central que divide a distribuição ao meio",
-                        "std_dev": "Desvio padrão: medida de dispersão dos valores em relação à média",
-                        "variance": "Variância: média dos quadrados dos desvios em relação à média",
-                        "coefficient_of_variation": "Coeficiente de variação: desvio padrão relativo à média (%)",
-                        "std_error": "Erro padrão: estimativa do desvio padrão da média amostral",
-                        "min": "Valor mínimo encontrado",
-                        "max": "Valor máximo encontrado",
-                        "range": "Amplitude: diferença entre o maior e o menor valor",
-                        "q1": "Primeiro quartil: 25% dos valores são menores que este",
-                        "q3": "Terceiro quartil: 75% dos valores são menores que este",
-                        "iqr": "Intervalo interquartil: diferença entre Q3 e Q1"
-                    }
+                    "descriptions": self._STAT_DESCRIPTIONS
                 }
         
         # estatísticas para campos categóricos
         categorical_stats = {}
-        
-        # verifica tipo de cultura para determinar campos categóricos
-        culture_type = cultures[0].get("tipo")
-        
-        if culture_type == "Soja":
-            variedades = [culture.get("variedade") for culture in cultures]
-            categorical_stats["variedade"] = dict(Counter(variedades))
-        elif culture_type == "Cana-de-Açúcar":
-            ciclos = [culture.get("ciclo") for culture in cultures]
-            categorical_stats["ciclo"] = dict(Counter(ciclos))
+        if category_field:
+            categorical_stats[category_field] = dict(Counter(columns[category_field]))
         
         # estatísticas para irrigação
-        irrigation_count = sum(1 for culture in cultures if culture.get("irrigacao", False))
+        irrigation_count = int(np.count_nonzero(columns["irrigacao"]))
         categorical_stats["irrigacao"] = {
             "com_irrigacao": irrigation_count,
             "sem_irrigacao": len(cultures) - irrigation_count,
@@ -826,19 +1508,12 @@ class CultureController:
             "numeric": numeric_stats,
             "categorical": categorical_stats,
             "sample_size": len(cultures),
-            "explanation": {
-                "desvio_padrao": "O desvio padrão é uma medida estatística que indica quanto os valores da amostra variam em relação à média. "
-                                "Um desvio padrão baixo indica que os valores tendem a estar próximos da média, enquanto um desvio padrão alto "
-                                "indica que os valores estão espalhados por uma gama mais ampla. É calculado como a raiz quadrada da variância.",
-                "variancia": "A variância mede a dispersão dos valores em relação à média, calculando a média dos quadrados dos desvios. "
-                            "Quanto maior a variância, mais dispersos estão os valores em relação à média.",
-                "erro_padrao": "O erro padrão é uma estimativa do desvio padrão da média amostral. Ele indica a precisão da estimativa da média "
-                              "populacional baseada na amostra atual. Um erro padrão menor indica uma estimativa mais precisa da média."
-            }
+            "explanation": self._STAT_EXPLANATION
         }
 
 
-    def _calculate_rectangular_strategy(self, area: float, espacamento: float, proporcao: float = 1.5) -> int:
+    @staticmethod
+    def _calculate_rectangular_strategy(area: float, espacamento: float, proporcao: float = 1.5) -> int:
         """
         Estratégia de cálculo para área retangular
 
@@ -853,49 +1528,104 @@ class CultureController:
         # converte hectares para metros quadrados
         area_m2 = area * 10000
 
-        # calcula as dimensões do retângulo
+        # calcula a largura do retângulo
         # para um retângulo de área A e proporção p entre comprimento e largura:
         # comprimento = sqrt(A * p)
         # largura = sqrt(A / p)
-        comprimento = math.sqrt(area_m2 * proporcao)
+        # (as linhas são contadas ao longo da largura; o comprimento não é necessário)
         largura = math.sqrt(area_m2 / proporcao)
 
         # calcula o número de linhas ao longo da largura
         return int(largura / espacamento)
 
-    def _calculate_inputs(self, culture_data: Dict[str, Any]) -> None:
+    def _calculate_inputs(self, culture_data: Dict[str, Any], area: Optional[float] = None,
+                          dosagem_herbicida: Optional[float] = None,
+                          dosagem_fertilizante: Optional[float] = None,
+                          linhas: Optional[int] = None, espacamento: Optional[float] = None,
+                          area_m2: Optional[float] = None) -> None:
         """
         Calcula a quantidade de insumos necessários para a cultura
 
         Args:
             culture_data (Dict[str, Any]): Dados da cultura a ser processada
+            area (Optional[float]): Área em hectares (padrão: lida de culture_data)
+            dosagem_herbicida (Optional[float]): Dosagem de herbicida por hectare (padrão: lida de culture_data)
+            dosagem_fertilizante (Optional[float]): Dosagem de fertilizante por hectare (padrão: lida de culture_data)
+            linhas (Optional[int]): Número de linhas (padrão: lido de culture_data)
+            espacamento (Optional[float]): Espaçamento em metros (padrão: lido de culture_data)
+            area_m2 (Optional[float]): Área já convertida para m² (padrão: calculada a partir de area)
 
         Returns:
             None: Os resultados são adicionados diretamente ao dicionário de dados
         """
-        area = culture_data.get("area", 0)
-
-        # calcula quantidade de herbicida
-        dosagem_herbicida = culture_data.get("dosagem_herbicida", 0)
-        culture_data["quantidade_herbicida"] = area * dosagem_herbicida
-
-        # calcula quantidade de fertilizante
-        dosagem_fertilizante = culture_data.get("dosagem_fertilizante", 0)
-        culture_data["quantidade_fertilizante"] = area * dosagem_fertilizante
-
-        # calcula quantidade total de produtos químicos
-        linhas = culture_data.get("linhas_calculadas", 0)
-        espacamento = culture_data.get("espacamento", 0)
+        # valores não informados são lidos do próprio dicionário
+        if area is None:
+            area = culture_data.get("area", 0)
+        if dosagem_herbicida is None:
+            dosagem_herbicida = culture_data.get("dosagem_herbicida", 0)
+        if dosagem_fertilizante is None:
+            dosagem_fertilizante = culture_data.get("dosagem_fertilizante", 0)
+        if linhas is None:
+            linhas = culture_data.get("linhas_calculadas", 0)
+        if espacamento is None:
+            espacamento = culture_data.get("espacamento", 0)
+        if area_m2 is None:
+            area_m2 = area * 10000
+
+        # calcula quantidade de herbicida e de fertilizante
+        insumos = {
+            "quantidade_herbicida": area * dosagem_herbicida,
+            "quantidade_fertilizante": area * dosagem_fertilizante
+        }
 
         # estima o comprimento da linha com base na área e espaçamento
         if linhas > 0 and espacamento > 0:
             # para uma estimativa simples, assumimos que o comprimento é aproximadamente
             # a área dividida pelo número de linhas vezes o espaçamento
-            comprimento_linha = (area * 10000) / (linhas * espacamento)
-            culture_data["comprimento_linha"] = comprimento_linha
+            comprimento_linha = area_m2 / (linhas * espacamento)
+            insumos["comprimento_linha"] = comprimento_linha
 
             # total de metros lineares de plantio
-            culture_data["metros_lineares_total"] = linhas * comprimento_linha
+            insumos["metros_lineares_total"] = linhas * comprimento_linha
+
+        culture_data.update(insumos)
+
+    def _calculate_inputs_batch(self, areas: np.ndarray, espacamentos: np.ndarray, linhas: np.ndarray,
+                                dosagem_herbicida: Union[float, np.ndarray],
+                                dosagem_fertilizante: Union[float, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Calcula a quantidade de insumos de várias culturas de uma só vez (vetorizado)
+
+        Usa as mesmas fórmulas de _calculate_inputs; quando não há linhas ou
+        espaçamento válidos, comprimento_linha e metros_lineares_total ficam NaN.
+
+        Args:
+            areas (np.ndarray): Áreas em hectares
+            espacamentos (np.ndarray): Espaçamentos entre linhas em metros
+            linhas (np.ndarray): Número de linhas de cada cultura
+            dosagem_herbicida (Union[float, np.ndarray]): Dosagem de herbicida por hectare
+            dosagem_fertilizante (Union[float, np.ndarray]): Dosagem de fertilizante por hectare
+
+        Returns:
+            Dict[str, np.ndarray]: Arrays de quantidade_herbicida, quantidade_fertilizante,
+                comprimento_linha e metros_lineares_total
+        """
+        areas = np.asarray(areas, dtype=np.float64)
+        espacamentos = np.asarray(espacamentos, dtype=np.float64)
+        linhas = np.asarray(linhas)
+
+        # comprimento estimado da linha calculado só no subconjunto com linhas e
+        # espaçamento positivos (sem divisões descartadas nem por zero)
+        valid = np.flatnonzero((linhas > 0) & (espacamentos > 0))
+        comprimento_linha = np.full(areas.shape, np.nan)
+        comprimento_linha[valid] = (areas[valid] * 10000) / (linhas[valid] * espacamentos[valid])
+
+        return {
+            "quantidade_herbicida": areas * dosagem_herbicida,
+            "quantidade_fertilizante": areas * dosagem_fertilizante,
+            "comprimento_linha": comprimento_linha,
+            "metros_lineares_total": linhas * comprimento_linha
+        }
 
     def get_weather_data(self, lat: float = -23.5505, lon: float = -46.6333) -> Optional[Dict[str, Any]]:
         """
@@ -908,21 +1638,48 @@ class CultureController:
         Returns:
             Optional[Dict[str, Any]]: Dados meteorológicos ou None se falhar
         """
-        from services.r_integration import get_weather_data
+        # coordenadas arredondadas (~1 km), para reaproveitar consultas próximas
+        cache_key = (round(lat, 2), round(lon, 2))
 
         # se tiver os dados em cache e eles são recentes, retornar do cache
-        if self.weather_data is not None:
-            # TODO: Implementar verificação de idade do cache
-            pass
+        with self._weather_lock:
+            cached = self._weather_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[0] < self.WEATHER_CACHE_TTL:
+                self._weather_cache.move_to_end(cache_key)
+                return cached[1]
 
-        # obtém novos dados meteorológicos
+        # obtém novos dados meteorológicos (fora do lock, a consulta é lenta)
         try:
-            self.weather_data = get_weather_data(lat, lon)
-            return self.weather_data
+            weather_data = _get_weather_data(lat, lon)
+            if weather_data is not None:
+                with self._weather_lock:
+                    self._weather_cache[cache_key] = (time.monotonic(), weather_data)
+                    self._weather_cache.move_to_end(cache_key)
+                    if len(self._weather_cache) > self.WEATHER_CACHE_SIZE:
+                        self._weather_cache.popitem(last=False)
+            return weather_data
         except Exception as e:
             logger.error(f"Erro ao obter dados meteorológicos: {str(e)}")
             return None
 
+    @staticmethod
+    def _dig(data: Any, *keys: str) -> Any:
+        """
+        Percorre dicionários aninhados seguindo as chaves informadas
+
+        Args:
+            data (Any): Estrutura de dicionários aninhados
+            *keys (str): Caminho de chaves a percorrer
+
+        Returns:
+            Any: Valor encontrado ou None se algum nível não existir
+        """
+        for key in keys:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+
     def get_recommendations(self, culture_data: Dict[str, Any], weather_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Obtém recomendações baseadas nos dados da cultura e meteorológicos
@@ -934,33 +1691,27 @@ class CultureController:
         Returns:
             Optional[Dict[str, Any]]: Recomendações ou None se falhar
         """
-        from services.r_integration import get_recommendations
-
         try:
             # extrai dados reais de meteorologia da estrutura aninhada
             actual_weather_data = None
 
             # verifica se têm dados meteorológicos com a estrutura esperada
-            if weather_data and "data" in weather_data and "weather" in weather_data["data"]:
-                if isinstance(weather_data["data"]["weather"], list) and len(weather_data["data"]["weather"]) > 0:
-                    # obter o primeiro objeto de dados meteorológicos da lista
-                    actual_weather_data = weather_data["data"]["weather"][0]
-
-                    # adiciona as informações de análise aos dados meteorológicos
-                    if "analysis" in weather_data["data"]:
-                        # adiciona análises específicas sobre temperatura, umidade e vento
-                        if "temperature" in weather_data["data"]["analysis"]:
-                            actual_weather_data["temperature_analysis"] = weather_data["data"]["analysis"]["temperature"]
-                        if "humidity" in weather_data["data"]["analysis"]:
-                            actual_weather_data["humidity_analysis"] = weather_data["data"]["analysis"]["humidity"]
-                        if "wind" in weather_data["data"]["analysis"]:
-                            actual_weather_data["wind_analysis"] = weather_data["data"]["analysis"]["wind"]
-                        # adiciona impacto agrícola se disponível
-                        if "agricultural_impact" in weather_data["data"]["analysis"]:
-                            actual_weather_data["agricultural_impact"] = weather_data["data"]["analysis"]["agricultural_impact"]
-                elif isinstance(weather_data["data"]["weather"], dict):
-                    # se for um dicionário único, usar diretamente
-                    actual_weather_data = weather_data["data"]["weather"]
+            data = self._dig(weather_data, "data")
+            weather = self._dig(data, "weather")
+            if isinstance(weather, list) and weather:
+                # obter o primeiro objeto de dados meteorológicos da lista
+                actual_weather_data = weather[0]
+
+                # adiciona as análises específicas (temperatura, umidade, vento e
+                # impacto agrícola) aos dados meteorológicos
+                analysis = self._dig(data, "analysis")
+                if analysis:
+                    for source_key, target_key in self._WEATHER_ANALYSIS_FIELDS:
+                        if source_key in analysis:
+                            actual_weather_data[target_key] = analysis[source_key]
+            elif isinstance(weather, dict):
+                # se for um dicionário único, usar diretamente
+                actual_weather_data = weather
 
             # se não conseguir extrair os dados meteorológicos, retorna recomendações básicas
             if not actual_weather_data:
@@ -975,19 +1726,42 @@ class CultureController:
                             "needs_irrigation": culture_data.get("irrigacao", False),
                             "ideal_for_fieldwork": None
                         },
-                        "basic": {
-                            "irrigation": "Verificar condições locais antes de decidir sobre irrigação.",
-                            "chemicals_application": "Verificar previsão do tempo antes de aplicar defensivos.",
-                            "fieldwork": "Planejar atividades de campo com base na previsão meteorológica local."
-                        }
+                        "basic": self._BASIC_WEATHER_RECOMMENDATIONS
                     }
                 }
 
+            # mesma cultura com os mesmos dados meteorológicos: reaproveita a resposta do R
+            cache_key = json.dumps(
+                [
+                    [culture_data.get(field) for field in self._RECOMMENDATION_CULTURE_FIELDS],
+                    actual_weather_data
+                ],
+                sort_keys=True, default=str
+            )
+            with self._recommendations_lock:
+                cached = self._recommendations_cache.get(cache_key)
+                if cached is not None:
+                    self._recommendations_cache.move_to_end(cache_key)
+            if cached is not None:
+                # cópia, para que o chamador não altere a entrada do cache
+                return copy.deepcopy(cached)
+
             # passa os dados meteorológicos extraídos para o serviço de recomendações
-            logger.debug(f"Enviando dados meteorológicos para recomendações: {json.dumps(actual_weather_data, indent=2)}")
-            return get_recommendations(culture_data, actual_weather_data)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Enviando dados meteorológicos para recomendações: %s",
+                             json.dumps(actual_weather_data))
+            recommendations = _get_recommendations(culture_data, actual_weather_data)
+
+            # guarda apenas respostas válidas, descartando as mais antigas
+            if recommendations is not None:
+                with self._recommendations_lock:
+                    self._recommendations_cache[cache_key] = copy.deepcopy(recommendations)
+                    if len(self._recommendations_cache) > self.RECOMMENDATIONS_CACHE_SIZE:
+                        self._recommendations_cache.popitem(last=False)
+            return recommendations
         except Exception as e:
             logger.error(f"Erro ao obter recomendações: {str(e)}")
-            logger.debug(f"Detalhes do erro: {traceback.format_exc()}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Detalhes do erro: %s", traceback.format_exc())
             return None
 
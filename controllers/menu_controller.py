@@ -1,12 +1,191 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import heapq
 import logging
+import os
 import re
+import select
+import sys
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
+# padrões para extrair a produtividade dos textos gerados pelo R
+_RE_PROD_SOJA = re.compile(r"Produtividade estimada: (\d+\.?\d*) sacas/ha")
+_RE_PROD_CANA = re.compile(r"Produtividade estimada: (\d+\.?\d*) ton/ha")
+_RE_TOTAL_SOJA = re.compile(r"(\d+) sacas totais estimadas")
+_RE_TOTAL_CANA = re.compile(r"(\d+) toneladas totais estimadas")
+
+# formato dos IDs sugeridos pelo frontend (ex: soja_3, cana_0)
+# (usado com fullmatch: "$" aceitaria uma quebra de linha no final)
+_SUGGESTED_ID_RE = re.compile(r'(soja|cana)_(\d+)')
+
+# valores aceitos como "sim" nos campos booleanos dos formulários
+_TRUTHY_STRINGS = frozenset({'true', 'sim', 's', 'yes', 'y', '1', 'on'})
+
+# menu principal do modo CLI, montado uma única vez
+_MENU_SEPARATOR = "=" * 50
+_MENU_BANNER = "\n".join([
+    "",
+    _MENU_SEPARATOR,
+    "  FARMTECH SOLUTIONS - SISTEMA DE GESTÃO AGRÍCOLA",
+    _MENU_SEPARATOR,
+    "1. Entrada de dados",
+    "2. Visualização de dados",
+    "3. Atualização de dados",
+    "4. Deleção de dados",
+    "5. Sair do programa",
+    _MENU_SEPARATOR,
+    ""
+])
+
+# textos fixos dos submenus CLI
+_INPUT_MENU = "\n".join([
+    "",
+    "----- ENTRADA DE DADOS -----",
+    "Escolha o tipo de cultura:",
+    "1. Soja",
+    "2. Cana-de-Açúcar",
+    ""
+])
+_CICLO_OPTIONS = "\n".join([
+    "1. Curto (8-10 meses)",
+    "2. Médio (12-14 meses)",
+    "3. Longo (16-18 meses)",
+    ""
+])
+_CICLO_MENU = "\nEscolha o ciclo da cana:\n" + _CICLO_OPTIONS
+_NEW_CICLO_MENU = "\nEscolha o novo ciclo da cana:\n" + _CICLO_OPTIONS
+
+# recomendações exibidas após cadastrar uma cana-de-açúcar (CLI)
+_SUGARCANE_RECOMMENDATION_TEMPLATE = "\n".join([
+    "",
+    "----- RECOMENDAÇÕES PARA CANA-DE-AÇÚCAR -----",
+    "Ciclo: {ciclo} ({ciclo_info[duracao]})",
+    "Descrição: {ciclo_info[descricao]}",
+    "",
+    "Espaçamento: {espacamento[mensagem]}",
+    "  Recomendado: {esp[min]}-{esp[max]} m (ideal: {esp[ideal]} m)",
+    "",
+    "Área: {area[mensagem]}",
+    "  Recomendado: {area_rec[min]}-{max_area} ha (ideal: {area_rec[ideal]} ha)",
+    "",
+    "Irrigação: {irrig_status}",
+    "  {irrig[mensagem]}",
+    "  Sistema: {irrig[sistema]}",
+    "  Frequência: {irrig[frequencia]}",
+    "  Volume: {irrig[volume]}",
+    "  Eficiência: {irrig[eficiencia]}",
+    ""
+])
+
+# ciclo da cana correspondente a cada opção dos menus acima
+_CICLO_CHOICES = MappingProxyType({"1": "curto", "2": "médio", "3": "longo"})
+
+
+def _parse_ciclo_choice(choice: str) -> str:
+    """Converte a opção digitada no menu de ciclo; opções desconhecidas viram médio"""
+    return _CICLO_CHOICES.get(choice, "médio")
+
+
+def _parse_yes(answer: str) -> bool:
+    """Interpreta a resposta de uma pergunta (s/n)"""
+    return answer.lower() == 's'
+
+
+# perguntas feitas após a escolha do tipo de cultura: (texto, conversão)
+_SOY_INPUT_FIELDS = (
+    ("Área de plantio (hectares): ", float),
+    ("Espaçamento entre linhas (metros): ", float),
+    ("Variedade da soja (ex: convencional, transgênica): ", str),
+    ("Adicionar sistema de irrigação? (s/n): ", _parse_yes)
+)
+_CANE_INPUT_FIELDS = (
+    ("Área de plantio (hectares): ", float),
+    ("Espaçamento entre linhas (metros): ", float),
+    (_CICLO_MENU + "Digite o número correspondente ao ciclo: ", _parse_ciclo_choice),
+    ("Adicionar sistema de irrigação? (s/n): ", _parse_yes)
+)
+_UPDATE_HEADER = "\n----- ATUALIZAÇÃO DE DADOS -----\n"
+_UPDATE_OPTIONS = "\n".join([
+    "",
+    "O que deseja atualizar?",
+    "1. Área de plantio",
+    "2. Espaçamento entre linhas",
+    ""
+])
+_CANE_UPDATE_OPTIONS = _UPDATE_OPTIONS + "\n".join([
+    "3. Ciclo da cana-de-açúcar",
+    "4. Sistema de irrigação",
+    ""
+])
+_DELETE_HEADER = "\n----- DELEÇÃO DE DADOS -----\n"
+
+# campos numéricos do formulário de criação: (nome, conversão, valor padrão)
+_CREATE_SCHEMA = (
+    ("culture_type", int, 0),
+    ("area", float, 0),
+    ("espacamento", float, 0)
+)
+
+# alertas exibidos quando a cultura não tem irrigação
+_SUGARCANE_IRRIGATION_ALERT = "Irrigação é recomendada para cultivo de cana-de-açúcar."
+_SOY_IRRIGATION_ALERT = "Irrigação é recomendada para maximizar a produtividade da soja."
+
+# período ótimo de plantio por (tipo, ciclo); ciclo None é o padrão do tipo
+_OPTIMAL_PERIOD_TABLE = {
+    ("Cana-de-Açúcar", "curto"): "Fevereiro a Abril",
+    ("Cana-de-Açúcar", "médio"): "Janeiro a Março",
+    ("Cana-de-Açúcar", "longo"): "Outubro a Dezembro",
+    ("Cana-de-Açúcar", None): "Janeiro a Março (padrão)",
+    ("Soja", None): "Setembro a Novembro"
+}
+
+# partes da análise meteorológica montadas a partir de campos avulsos: (origem, destino)
+_WEATHER_ANALYSIS_PARTS = (
+    ("temperature_analysis", "temperature"),
+    ("humidity_analysis", "humidity"),
+    ("wind_analysis", "wind"),
+    ("agricultural_impact", "agricultural_impact")
+)
+
+# campos da cultura incluídos na análise meteorológica, com seus valores padrão
+_CULTURA_INFO_FIELDS = (
+    ("tipo", "Desconhecida"),
+    ("area", 0),
+    ("espacamento", 0),
+    ("irrigacao", False),
+    ("linhas_calculadas", 0),
+    ("variedade", ""),
+    ("ciclo", ""),
+    ("quantidade_herbicida", 0),
+    ("quantidade_fertilizante", 0)
+)
+
+
+def _parse_bool(value: Any) -> bool:
+    """
+    Interpreta um valor de formulário (booleano ou texto) como sim/não
+
+    Args:
+        value (Any): Valor recebido do formulário
+
+    Returns:
+        bool: True se o valor corresponde a um dos textos aceitos como "sim"
+    """
+    if isinstance(value, bool):
+        return value
+    if not isinstance(value, str):
+        value = str(value)
+    # caso comum: texto já normalizado, verificado sem criar novas strings
+    if value in _TRUTHY_STRINGS:
+        return True
+    return value.strip().lower() in _TRUTHY_STRINGS
+
+
 class MenuController:
     """
     Controlador do menu para a aplicação.
@@ -14,12 +193,54 @@ class MenuController:
     Suporta tanto interface CLI quanto integração com formulários web.
     """
 
+    # número máximo de combinações (estratégia, área, espaçamento) com linhas em cache
+    LINES_CACHE_SIZE = 128
+
     def __init__(self, culture_controller):
         """Inicializa o controlador do menu"""
         self.culture_controller = culture_controller
+
+        # métodos do controlador de cultura usados com frequência, já vinculados
+        self._validate_sugarcane = culture_controller.validate_sugarcane_parameters
+        self._validate_soybean = culture_controller.validate_soybean_parameters
+        self._calc_lines = culture_controller.calculate_lines
+        self._calc_inputs = culture_controller._calculate_inputs
         self.is_running = False
         self.data = []  # Vetor de dados para armazenamento
 
+        # versão da lista de culturas, incrementada quando itens são incluídos,
+        # substituídos ou removidos, ou quando a área de uma cultura muda;
+        # invalida os resultados em cache de get_cultures e da listagem CLI
+        self._data_version = 0
+        self._get_cultures_cache = (None, None)
+        self._summary_cache = (None, None)
+
+        # linhas de plantio já calculadas por (estratégia, área, espaçamento)
+        self._lines_cache = OrderedDict()
+
+        # posições marcadas como deletadas (heap), reaproveitadas por create_culture
+        self._deleted_positions = []
+
+        # operações do menu CLI indexadas pela opção escolhida
+        self._menu_handlers = {
+            1: self._handle_data_input,      # entrada de dados
+            2: self._handle_data_output,     # visualização de dados
+            3: self._handle_data_update,     # atualização de dados
+            4: self._handle_data_deletion    # deleção de dados
+        }
+
+        # campos editáveis no menu de atualização (CLI), por opção escolhida;
+        # ciclo e irrigação só existem para cana-de-açúcar
+        self._update_handlers = {
+            1: self._update_area,
+            2: self._update_espacamento
+        }
+        self._cane_update_handlers = {
+            **self._update_handlers,
+            3: self._update_ciclo,
+            4: self._update_irrigacao
+        }
+
     def run(self, mode="cli") -> Dict[str, Any]:
         """
         Executa o menu interativo (modo CLI) ou retorna resultado (modo API)
@@ -55,7 +276,9 @@ class MenuController:
         }
 
         while self.is_running:
-            self._display_menu()
+            # com opções já digitadas à frente, não redesenha o menu
+            if not self._input_pending():
+                self._display_menu()
             choice = input("Escolha uma opção: ")
 
             try:
@@ -73,24 +296,35 @@ class MenuController:
                 ):
                     if isinstance(result["data"], list):
                         self.data = result["data"]
-
-                # exibe o resultado da operação
-                print("\nResultado da operação:")
-                print(f"Status: {result['status']}")
-                print(f"Mensagem: {result['message']}")
-                if result.get("data") is not None:
-                    print(f"Dados: {result['data']}")
-
-                input("\nPressione Enter para continuar...")
+                        self._data_version += 1
+
+                # exibe o resultado da operação (uma única escrita)
+                output = (
+                    f"\nResultado da operação:\n"
+                    f"Status: {result['status']}\n"
+                    f"Mensagem: {result['message']}\n"
+                )
+                data = result.get("data")
+                if data is not None:
+                    if isinstance(data, list):
+                        # marcadores de deleção não são exibidos
+                        data = [
+                            item for item in data
+                            if not (isinstance(item, dict) and item.get("deleted", False))
+                        ]
+                    output += f"Dados: {data}\n"
+                sys.stdout.write(output)
+
+                self._wait_for_enter()
 
             except ValueError:
                 print("Opção inválida. Por favor, insira um número.")
-                input("\nPressione Enter para continuar...")
+                self._wait_for_enter()
 
             except Exception as e:
                 logger.error(f"Erro ao processar opção do menu: {str(e)}")
                 print(f"Erro ao processar opção: {str(e)}")
-                input("\nPressione Enter para continuar...")
+                self._wait_for_enter()
 
         # retorna os dados coletados durante a execução
         return {
@@ -99,17 +333,68 @@ class MenuController:
             "message": "Operação finalizada pelo usuário"
         }
 
+    @staticmethod
+    def _input_pending() -> bool:
+        """
+        Verifica se o usuário já digitou entradas ainda não lidas (apenas terminais POSIX)
+
+        Returns:
+            bool: True se há entrada pendente no terminal
+        """
+        if os.name != "posix" or not sys.stdin.isatty():
+            return False
+        try:
+            readable, _, _ = select.select([sys.stdin], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return bool(readable)
+
+    def _wait_for_enter(self) -> None:
+        """Pausa até o usuário pressionar Enter; omite o aviso se a entrada já foi digitada"""
+        input("" if self._input_pending() else "\nPressione Enter para continuar...")
+
+    @staticmethod
+    def _batch_input(fields: tuple) -> List[Any]:
+        """
+        Lê e converte as respostas de uma sequência de perguntas
+
+        Num terminal cada pergunta é feita com input(). Com entrada redirecionada
+        (scripts, pipes) as respostas são lidas direto de stdin, uma por linha, e
+        as perguntas alcançadas são escritas numa única chamada ao final. Como
+        antes, a leitura para na primeira resposta inválida, sem consumir as
+        linhas seguintes.
+
+        Args:
+            fields (tuple): Pares (texto da pergunta, conversão), na ordem
+
+        Returns:
+            List[Any]: Respostas já convertidas, uma por pergunta
+
+        Raises:
+            ValueError: Se uma resposta não puder ser convertida
+            EOFError: Se a entrada terminar antes da última pergunta
+        """
+        if sys.stdin.isatty():
+            return [parse(input(prompt)) for prompt, parse in fields]
+
+        readline = sys.stdin.readline
+        answers = []
+        reached = 0
+        try:
+            for _, parse in fields:
+                reached += 1
+                line = readline()
+                if not line:
+                    # fim da entrada, mesmo comportamento de input()
+                    raise EOFError("EOF when reading a line")
+                answers.append(parse(line.rstrip("\n")))
+        finally:
+            sys.stdout.write("".join(prompt for prompt, _ in fields[:reached]))
+        return answers
+
     def _display_menu(self) -> None:
         """Exibe o menu principal (apenas para modo CLI)"""
-        print("\n" + "="*50)
-        print("  FARMTECH SOLUTIONS - SISTEMA DE GESTÃO AGRÍCOLA")
-        print("="*50)
-        print("1. Entrada de dados")
-        print("2. Visualização de dados")
-        print("3. Atualização de dados")
-        print("4. Deleção de dados")
-        print("5. Sair do programa")
-        print("="*50)
+        sys.stdout.write(_MENU_BANNER)
 
     def _process_menu_choice(self, choice: int) -> Dict[str, Any]:
         """
@@ -121,36 +406,24 @@ class MenuController:
         Returns:
             Dict[str, Any]: Resultado da operação
         """
-        result = {
-            "status": "error",
-            "data": None,
-            "message": "Opção não implementada"
-        }
+        handler = self._menu_handlers.get(choice)
+        if handler is not None:
+            return handler()
 
-        if choice == 1:
-            # entrada de dados
-            result = self._handle_data_input()
-        elif choice == 2:
-            # visualização de dados
-            result = self._handle_data_output()
-        elif choice == 3:
-            # atualização de dados
-            result = self._handle_data_update()
-        elif choice == 4:
-            # deleção de dados
-            result = self._handle_data_deletion()
-        elif choice == 5:
+        if choice == 5:
             # sair do programa
             self.is_running = False
-            result = {
+            return {
                 "status": "success",
                 "data": self.data,
                 "message": "Programa encerrado"
             }
-        else:
-            result["message"] = "Opção inválida. Por favor, escolha uma opção entre 1 e 5."
 
-        return result
+        return {
+            "status": "error",
+            "data": None,
+            "message": "Opção inválida. Por favor, escolha uma opção entre 1 e 5."
+        }
 
     # === API WEB ENDPOINTS ===
     def create_culture(self, form_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -164,9 +437,13 @@ class MenuController:
             Dict[str, Any]: Resultado da operação
         """
         try:
-            # extrai o tipo de cultura
-            culture_type = int(form_data.get('culture_type', 0))
-            if culture_type not in [1, 2]:
+            # converte os campos numéricos de uma só vez
+            get = form_data.get
+            parsed = {field: cast(get(field, default)) for field, cast, default in _CREATE_SCHEMA}
+
+            # valida o tipo de cultura
+            culture_type = parsed["culture_type"]
+            if culture_type not in (1, 2):
                 return {
                     "status": "error", 
                     "data": None, 
@@ -176,9 +453,8 @@ class MenuController:
                     ),
                 }
 
-            # extrai outros parâmetros
-            area = float(form_data.get('area', 0))
-            espacamento = float(form_data.get('espacamento', 0))
+            area = parsed["area"]
+            espacamento = parsed["espacamento"]
             
             # parâmetros adicionais específicos para cada cultura
             additional_params = {}
@@ -188,13 +464,7 @@ class MenuController:
                 additional_params["ciclo"] = form_data.get('ciclo', 'médio')
 
             # verifica irrigação - suporta tanto booleano quanto string
-            irrigacao_value = form_data.get('irrigacao', 'false')
-            if isinstance(irrigacao_value, bool):
-                with_irrigation = irrigacao_value
-            else:
-                with_irrigation = str(irrigacao_value).lower() in [
-                    'true', 'sim', 's', 'yes', 'y', '1', 'on'
-                ]
+            with_irrigation = _parse_bool(form_data.get('irrigacao', 'false'))
 
             # cria cultura usando o controlador
             culture_data = self.culture_controller.create_culture(
@@ -207,42 +477,37 @@ class MenuController:
 
             # verifica se há um ID sugerido pelo frontend
             suggested_id = form_data.get('suggested_id')
-            if suggested_id:
-                # verifica se o id sugerido está no formato esperado
-                id_pattern = r'^(soja|cana)_(\d+)$'
-                if re.match(id_pattern, suggested_id):
-                    # adiciona o ID sugerido aos dados da cultura
-                    culture_data['id'] = suggested_id
+
+            # verifica se o id sugerido está no formato esperado (uma única vez)
+            match = _SUGGESTED_ID_RE.fullmatch(suggested_id) if suggested_id else None
+            if match:
+                # adiciona o ID sugerido aos dados da cultura
+                culture_data['id'] = suggested_id
             
             # adiciona ao vetor de dados
             # verifica se há uma posição previamente deletada que pode reutilizar
             reused_position = None
             
             # se existe um ID sugerido, tenta reutilizar a posição exata
-            if suggested_id and len(self.data) > 0:
+            if match and len(self.data) > 0:
                 # extrai o número do ID sugerido
-                match = re.match(r'^(soja|cana)_(\d+)$', suggested_id)
-                if match:
-                    type_prefix, id_num = match.groups()
-                    id_num = int(id_num)
-                    
-                    # procura uma posição disponível com esse ID
-                    for i, item in enumerate(self.data):
-                        if item.get('deleted', False) and (
-                            (item.get('id') == suggested_id) or
-                            (i == id_num and item.get('tipo') == type_prefix)
-                        ):
-                            reused_position = i
-                            break
-            
-            # se não encontrou posição específica para 
-            # reutilizar, procura qualquer posição
-            if reused_position is None:
+                type_prefix, id_num = match.groups()
+                id_num = int(id_num)
+
+                # procura uma posição disponível com esse ID
                 for i, item in enumerate(self.data):
-                    if item.get('deleted', False):
+                    if item.get('deleted', False) and (
+                        (item.get('id') == suggested_id) or
+                        (i == id_num and item.get('tipo') == type_prefix)
+                    ):
                         reused_position = i
                         break
             
+            # se não encontrou posição específica para 
+            # reutilizar, usa a primeira posição deletada
+            if reused_position is None:
+                reused_position = self._pop_deleted_position()
+            
             # se encontrou uma posição para reutilizar,
             # substitui a cultura deletada
             if reused_position is not None:
@@ -252,32 +517,16 @@ class MenuController:
                 # caso contrário, adiciona ao final do array
                 self.data.append(culture_data)
                 position = len(self.data) - 1
+            self._data_version += 1
             
             # mensagem de sucesso
             message = f"Cultura adicionada com sucesso. ID: {position}"
             
             # verifica se existem recomendações específicas para exibir na resposta
             if culture_type == 2 and "recomendacoes" in culture_data:
-                recomendacoes = culture_data["recomendacoes"]
-                
-                # adiciona alertas para parâmetros fora do recomendado
-                alerts = []
-                
-                if recomendacoes["espacamento"]["status"] != "adequado":
-                    alerts.append(recomendacoes["espacamento"]["mensagem"])
-                
-                if recomendacoes["area"]["status"] != "adequada":
-                    alerts.append(recomendacoes["area"]["mensagem"])
-                
-                if not with_irrigation:
-                    alerts.append(
-                        "Irrigação é recomendada para cultivo de cana-de-açúcar."
-                    )
-                
-                if alerts:
-                    message += "\n\nRecomendações importantes:\n" + "\n".join(
-                        f"- {alert}" for alert in alerts
-                    )
+                message += self._build_recommendation_alerts(
+                    culture_data["recomendacoes"], with_irrigation, _SUGARCANE_IRRIGATION_ALERT
+                )
 
             return {
                 "status": "success", 
@@ -301,10 +550,58 @@ class MenuController:
             }
 
 
+    @staticmethod
+    def _build_recommendation_alerts(recomendacoes: Dict[str, Any], with_irrigation: bool,
+                                     irrigation_alert: str) -> str:
+        """
+        Monta o trecho da mensagem com alertas para parâmetros fora do recomendado
+
+        Args:
+            recomendacoes (Dict[str, Any]): Recomendações retornadas pelo validador
+            with_irrigation (bool): Se a cultura tem sistema de irrigação
+            irrigation_alert (str): Alerta a incluir quando não há irrigação
+
+        Returns:
+            str: Alertas formatados para anexar à mensagem, ou "" se não houver
+        """
+        espacamento = recomendacoes["espacamento"]
+        area = recomendacoes["area"]
+
+        alerts = []
+        if espacamento["status"] != "adequado":
+            alerts.append(espacamento["mensagem"])
+        if area["status"] != "adequada":
+            alerts.append(area["mensagem"])
+        if not with_irrigation:
+            alerts.append(irrigation_alert)
+
+        if not alerts:
+            return ""
+        return "\n\nRecomendações importantes:\n" + "\n".join(f"- {alert}" for alert in alerts)
+
     def get_cultures(self) -> Dict[str, Any]:
         """
         Endpoint de API para obter todas as culturas
 
+        Returns:
+            Dict[str, Any]: Dados de todas as culturas
+        """
+        # o resultado guarda referências às culturas, então alterações feitas
+        # nelas já aparecem no cache; a chave inclui a identidade e o tamanho
+        # da lista para detectar inclusões feitas diretamente em self.data
+        cache_key = (self._data_version, id(self.data), len(self.data))
+        cached_key, cached_result = self._get_cultures_cache
+        if cached_key == cache_key:
+            return cached_result
+
+        result = self._build_cultures_result()
+        self._get_cultures_cache = (cache_key, result)
+        return result
+
+    def _build_cultures_result(self) -> Dict[str, Any]:
+        """
+        Monta a resposta de get_cultures a partir das culturas não deletadas
+
         Returns:
             Dict[str, Any]: Dados de todas as culturas
         """
@@ -348,7 +645,12 @@ class MenuController:
         """
         try:
             culture_id = int(culture_id)
-            if not (0 <= culture_id < len(self.data)):
+            try:
+                # índices negativos não são IDs válidos
+                if culture_id < 0:
+                    raise IndexError(culture_id)
+                culture = self.data[culture_id]
+            except IndexError:
                 return {
                     "status": "error",
                     "data": None,
@@ -356,7 +658,7 @@ class MenuController:
                 }
             
             # verificar se a cultura não está deletada
-            if self.data[culture_id].get("deleted", False):
+            if culture.get("deleted", False):
                 return {
                     "status": "error",
                     "data": None,
@@ -365,7 +667,7 @@ class MenuController:
                 
             return {
                 "status": "success",
-                "data": self.data[culture_id],
+                "data": culture,
                 "message": "Cultura encontrada"
             }
         except (ValueError, TypeError):
@@ -423,15 +725,20 @@ class MenuController:
         """
         try:
             culture_id = int(culture_id)
-            if not (0 <= culture_id < len(self.data)):
+            try:
+                # índices negativos não são IDs válidos
+                if culture_id < 0:
+                    raise IndexError(culture_id)
+                culture = self.data[culture_id]
+            except IndexError:
                 return {
                     "status": "error",
                     "data": None,
                     "message": "Cultura não encontrada"
                 }
-                
+
             # verifica se a cultura não está deletada
-            if self.data[culture_id].get("deleted", False):
+            if culture.get("deleted", False):
                 return {
                     "status": "error",
                     "data": None,
@@ -441,8 +748,8 @@ class MenuController:
             # campos que podem ser atualizados
             updateable_fields = ['area', 'espacamento']
 
-            # atualiza os campos permitidos
-            updated = False
+            # atualiza os campos permitidos, registrando os que foram alterados
+            dirty = set()
             for field in updateable_fields:
                 if field in form_data:
                     value = float(form_data[field])
@@ -455,133 +762,74 @@ class MenuController:
                             ),
                         }
 
-                    self.data[culture_id][field] = value
-                    updated = True
+                    culture[field] = value
+                    dirty.add(field)
 
             # atualiza campos específicos por tipo de cultura
-            culture_type = self.data[culture_id].get('tipo')
+            culture_type = culture.get('tipo')
             if culture_type == 'Soja' and 'variedade' in form_data:
-                self.data[culture_id]['variedade'] = form_data['variedade']
-                updated = True
-                
-                # revalida parâmetros de soja após atualização
-                if (
-                    updated 
-                    and (
-                        'area' in form_data 
-                        or 'espacamento' in form_data 
-                        or 'variedade' in form_data
-                    )
-                ):
-                    area = self.data[culture_id].get('area', 0)
-                    espacamento = self.data[culture_id].get('espacamento', 0)
-                    variedade = self.data[culture_id].get('variedade', 'convencional')
-                    with_irrigation = self.data[culture_id].get('irrigacao', False)
-                    
-                    # obtém novas recomendações
-                    recomendacoes = self.culture_controller.validate_soybean_parameters(
-                        area, espacamento, variedade, with_irrigation
-                    )
-                    self.data[culture_id]['recomendacoes'] = recomendacoes
-                    
+                culture['variedade'] = form_data['variedade']
+                dirty.add('variedade')
             elif culture_type == 'Cana-de-Açúcar' and 'ciclo' in form_data:
-                self.data[culture_id]['ciclo'] = form_data['ciclo']
-                updated = True
-
-                # revalida parâmetros de cana-de-açúcar após atualização
-                if (
-                    updated 
-                    and (
-                        'area' in form_data 
-                        or 'espacamento' in form_data 
-                        or 'ciclo' in form_data
-                    )
-                ):
-                    area = self.data[culture_id].get('area', 0)
-                    espacamento = self.data[culture_id].get('espacamento', 0)
-                    ciclo = self.data[culture_id].get('ciclo', 'médio')
-                    with_irrigation = self.data[culture_id].get('irrigacao', False)
-                    
-                    # obtém novas recomendações
-                    recomendacoes = self.culture_controller.validate_sugarcane_parameters(
-                        area, espacamento, ciclo, with_irrigation
-                    )
-                    self.data[culture_id]['recomendacoes'] = recomendacoes
+                culture['ciclo'] = form_data['ciclo']
+                dirty.add('ciclo')
 
             # atualiza status de irrigação se presente
             if 'irrigacao' in form_data:
-                irrigacao = str(form_data.get('irrigacao', 'false')).lower() in [
-                    'true', 'sim', 's', 'yes', 'y', '1', 'on'
-                ]
-                self.data[culture_id]['irrigacao'] = irrigacao
-                updated = True
-                
-                # revalida parâmetros se irrigação foi alterada
+                culture['irrigacao'] = _parse_bool(form_data.get('irrigacao', 'false'))
+                dirty.add('irrigacao')
+
+            updated = bool(dirty)
+
+            # todos os campos acima afetam as recomendações: revalida uma única
+            # vez, já com os valores finais
+            if updated:
+                area = culture.get('area', 0)
+                espacamento = culture.get('espacamento', 0)
+                with_irrigation = culture.get('irrigacao', False)
+
                 if culture_type == 'Soja':
-                    area = self.data[culture_id].get('area', 0)
-                    espacamento = self.data[culture_id].get('espacamento', 0)
-                    variedade = self.data[culture_id].get('variedade', 'convencional')
-                    
-                    # obtém novas recomendações
-                    recomendacoes = self.culture_controller.validate_soybean_parameters(
-                        area, espacamento, variedade, irrigacao
+                    culture['recomendacoes'] = self._validate_soybean(
+                        area, espacamento, culture.get('variedade', 'convencional'), with_irrigation
                     )
-                    self.data[culture_id]['recomendacoes'] = recomendacoes
-                    
                 elif culture_type == 'Cana-de-Açúcar':
-                    area = self.data[culture_id].get('area', 0)
-                    espacamento = self.data[culture_id].get('espacamento', 0)
-                    ciclo = self.data[culture_id].get('ciclo', 'médio')
-                    
-                    # obtém novas recomendações
-                    recomendacoes = self.culture_controller.validate_sugarcane_parameters(
-                        area, espacamento, ciclo, irrigacao
+                    culture['recomendacoes'] = self._validate_sugarcane(
+                        area, espacamento, culture.get('ciclo', 'médio'), with_irrigation
                     )
-                    self.data[culture_id]['recomendacoes'] = recomendacoes
 
-            # recalcula valores necessários se houve atualização
-            if updated and ('area' in form_data or 'espacamento' in form_data):
-                if "linhas_calculadas" in self.data[culture_id]:
-                    linhas = self.culture_controller.calculate_lines(culture_id, self.data[culture_id])
-                    self.data[culture_id]["linhas_calculadas"] = linhas
+            # a área aparece na listagem dos menus CLI
+            if 'area' in dirty:
+                self._data_version += 1
+
+            # recalcula linhas e insumos só se a geometria mudou
+            if 'area' in dirty or 'espacamento' in dirty:
+                if "linhas_calculadas" in culture:
+                    linhas = self._cached_lines(culture_id, culture)
+                    culture["linhas_calculadas"] = linhas
                 
                 # recalcula insumos
-                self.culture_controller._calculate_inputs(self.data[culture_id])
+                self._calc_inputs(culture)
 
             # prepara mensagem com recomendações
             message = "Cultura atualizada com sucesso"
-            if updated and 'recomendacoes' in self.data[culture_id]:
-                recomendacoes = self.data[culture_id]['recomendacoes']
-                
-                # adiciona alertas para parâmetros fora do recomendado
-                alerts = []
-                
-                if recomendacoes["espacamento"]["status"] != "adequado":
-                    alerts.append(recomendacoes["espacamento"]["mensagem"])
-                
-                if recomendacoes["area"]["status"] != "adequada":
-                    alerts.append(recomendacoes["area"]["mensagem"])
-                
-                if not self.data[culture_id].get('irrigacao', False):
-                    if culture_type == 'Soja':
-                        alerts.append("Irrigação é recomendada para maximizar a produtividade da soja.")
-                    else:
-                        alerts.append("Irrigação é recomendada para cultivo de cana-de-açúcar.")
-                
-                if alerts:
-                    message += "\n\nRecomendações importantes:\n" + "\n".join(f"- {alert}" for alert in alerts)
+            if updated and 'recomendacoes' in culture:
+                message += self._build_recommendation_alerts(
+                    culture['recomendacoes'],
+                    culture.get('irrigacao', False),
+                    _SOY_IRRIGATION_ALERT if culture_type == 'Soja' else _SUGARCANE_IRRIGATION_ALERT
+                )
 
             if updated:
                 return {
                     "status": "success", 
-                    "data": self.data[culture_id], 
+                    "data": culture, 
                     "message": message,
-                    "recommendations": self.data[culture_id].get("recomendacoes")
+                    "recommendations": culture.get("recomendacoes")
                 }
             else:
                 return {
                     "status": "warning",
-                    "data": self.data[culture_id],
+                    "data": culture,
                     "message": "Nenhum campo foi atualizado"
                 }
 
@@ -612,24 +860,21 @@ class MenuController:
         """
         try:
             culture_id = int(culture_id)
-            if not (0 <= culture_id < len(self.data)):
+            try:
+                # índices negativos não são IDs válidos
+                if culture_id < 0:
+                    raise IndexError(culture_id)
+                # só valida o índice; _mark_deleted lê a cultura
+                self.data[culture_id]
+            except IndexError:
                 return {
                     "status": "error",
                     "data": None,
                     "message": "Cultura não encontrada"
                 }
 
-            # armazena o item a ser removido
-            item = self.data[culture_id]
-            removed_item = item.copy() if isinstance(item, dict) else item
-            
             # marca a cultura como deletada (em vez de remover do array)
-            # isso evita que os índices das outras culturas mudem
-            self.data[culture_id] = {
-                "deleted": True,
-                "id": culture_id,
-                "tipo": removed_item.get("tipo", "Desconhecida")
-            }
+            removed_item = self._mark_deleted(culture_id)
 
             # remove do cache de análise, se existir
             # esta informação será incluída na resposta para o frontend
@@ -667,6 +912,79 @@ class MenuController:
             }
 
 
+    def _mark_deleted(self, position: int) -> Dict[str, Any]:
+        """
+        Substitui a cultura por um marcador de deleção, sem remover do array
+
+        Assim os índices (IDs) das outras culturas não mudam, a remoção não
+        desloca elementos e a posição pode ser reaproveitada por create_culture.
+
+        Args:
+            position (int): Posição da cultura em self.data
+
+        Returns:
+            Dict[str, Any]: Cópia da cultura removida
+        """
+        item = self.data[position]
+        removed_item = item.copy() if isinstance(item, dict) else item
+
+        self.data[position] = {
+            "deleted": True,
+            "id": position,
+            "tipo": removed_item.get("tipo", "Desconhecida")
+        }
+        heapq.heappush(self._deleted_positions, position)
+        self._data_version += 1
+        return removed_item
+
+    def _cached_lines(self, culture_id: int, culture: Dict[str, Any]) -> int:
+        """
+        Calcula as linhas de plantio da cultura, reaproveitando resultados anteriores
+
+        O resultado depende apenas da estratégia, da área e do espaçamento, então
+        reentradas dos mesmos valores não refazem o cálculo.
+
+        Args:
+            culture_id (int): ID da cultura no vetor
+            culture (Dict[str, Any]): Dados da cultura
+
+        Returns:
+            int: Número de linhas calculado
+        """
+        cache_key = (
+            culture.get("strategy", "quadrado"),
+            culture.get("area", 0),
+            culture.get("espacamento", 0)
+        )
+        linhas = self._lines_cache.get(cache_key)
+        if linhas is not None:
+            self._lines_cache.move_to_end(cache_key)
+            return linhas
+
+        # erros de validação (espaçamento inválido) não entram no cache
+        linhas = self._calc_lines(culture_id, culture)
+        self._lines_cache[cache_key] = linhas
+        if len(self._lines_cache) > self.LINES_CACHE_SIZE:
+            self._lines_cache.popitem(last=False)
+        return linhas
+
+    def _pop_deleted_position(self) -> Optional[int]:
+        """
+        Retorna a menor posição marcada como deletada, retirando-a do heap
+
+        Posições que já foram reaproveitadas (ou deixaram de existir) são
+        descartadas ao chegar ao topo do heap.
+
+        Returns:
+            Optional[int]: Posição disponível ou None se não houver
+        """
+        deleted_positions = self._deleted_positions
+        while deleted_positions:
+            position = heapq.heappop(deleted_positions)
+            if position < len(self.data) and self.data[position].get("deleted", False):
+                return position
+        return None
+
     def calculate_culture_lines(self, culture_id: int) -> Dict[str, Any]:
         """
         Endpoint de API para calcular linhas de uma cultura
@@ -679,7 +997,12 @@ class MenuController:
         """
         try:
             culture_id = int(culture_id)
-            if not (0 <= culture_id < len(self.data)):
+            try:
+                # índices negativos não são IDs válidos
+                if culture_id < 0:
+                    raise IndexError(culture_id)
+                culture = self.data[culture_id]
+            except IndexError:
                 return {
                     "status": "error",
                     "data": None,
@@ -687,7 +1010,7 @@ class MenuController:
                 }
 
             # verifica se a cultura não está deletada
-            if self.data[culture_id].get("deleted", False):
+            if culture.get("deleted", False):
                 return {
                     "status": "error",
                     "data": None,
@@ -695,16 +1018,16 @@ class MenuController:
                 }
 
             # calcula linhas
-            linhas = self.culture_controller.calculate_lines(culture_id, self.data[culture_id])
-            self.data[culture_id]["linhas_calculadas"] = linhas
+            linhas = self._cached_lines(culture_id, culture)
+            culture["linhas_calculadas"] = linhas
 
             return {
                 "status": "success", 
                 "data": {
                     "cultura_id": culture_id,
-                    "tipo": self.data[culture_id].get("tipo", "Desconhecida"),
-                    "area": self.data[culture_id].get("area", 0),
-                    "espacamento": self.data[culture_id].get("espacamento", 0),
+                    "tipo": culture.get("tipo", "Desconhecida"),
+                    "area": culture.get("area", 0),
+                    "espacamento": culture.get("espacamento", 0),
                     "linhas_calculadas": linhas
                 }, 
                 "message": f"Cálculo realizado com sucesso. {linhas} linhas de plantio."
@@ -733,7 +1056,12 @@ class MenuController:
         """
         try:
             culture_id = int(culture_id)
-            if not (0 <= culture_id < len(self.data)):
+            try:
+                # índices negativos não são IDs válidos
+                if culture_id < 0:
+                    raise IndexError(culture_id)
+                culture = self.data[culture_id]
+            except IndexError:
                 return {
                     "status": "error",
                     "data": None,
@@ -741,7 +1069,7 @@ class MenuController:
                 }
 
             # verifica se a cultura não está deletada
-            if self.data[culture_id].get("deleted", False):
+            if culture.get("deleted", False):
                 return {
                     "status": "error",
                     "data": None,
@@ -759,7 +1087,7 @@ class MenuController:
 
             # obtém recomendações baseadas nos dados meteorológicos e da cultura
             recommendations = self.culture_controller.get_recommendations(
-                self.data[culture_id], weather_data
+                culture, weather_data
             )
 
             # extrai dados meteorológicos atuais e análise
@@ -768,30 +1096,22 @@ class MenuController:
             
             # extrai dados específicos para soja se disponíveis
             soy_specific = self._extract_soy_specific_data(
-                recommendations, self.data[culture_id]
+                recommendations, culture
             )
 
             # adiciona recomendações específicas para cana-de-açúcar
             sugarcane_recommendations = None
             if (
-                self.data[culture_id].get("tipo") == "Cana-de-Açúcar" 
-                and "recomendacoes" in self.data[culture_id]
+                culture.get("tipo") == "Cana-de-Açúcar" 
+                and "recomendacoes" in culture
             ):
-                sugarcane_recommendations = self.data[culture_id]["recomendacoes"]
+                sugarcane_recommendations = culture["recomendacoes"]
 
             # combina os dados para retorno
             result_data = {
                 "cultura_id": culture_id,
                 "cultura_info": {
-                    "tipo": self.data[culture_id].get("tipo", "Desconhecida"),
-                    "area": self.data[culture_id].get("area", 0),
-                    "espacamento": self.data[culture_id].get("espacamento", 0),
-                    "irrigacao": self.data[culture_id].get("irrigacao", False),
-                    "linhas_calculadas": self.data[culture_id].get("linhas_calculadas", 0),
-                    "variedade": self.data[culture_id].get("variedade", ""),
-                    "ciclo": self.data[culture_id].get("ciclo", ""),
-                    "quantidade_herbicida": self.data[culture_id].get("quantidade_herbicida", 0),
-                    "quantidade_fertilizante": self.data[culture_id].get("quantidade_fertilizante", 0)
+                    field: culture.get(field, default) for field, default in _CULTURA_INFO_FIELDS
                 },
                 "weather_data": weather_data,
                 "recommendations": recommendations,
@@ -803,14 +1123,14 @@ class MenuController:
                 # adiciona dados de produtividade e recomendações extras para o frontend
                 "productivity": {
                     "estimate": self._extract_productivity_estimate(
-                        self.data[culture_id], recommendations
+                        culture, recommendations
                     ),
                     "optimal_period": self._extract_optimal_period(
-                        self.data[culture_id],
+                        culture,
                         recommendations
                     )
                 },
-                "stats": self._extract_statistics(self.data[culture_id], recommendations)
+                "stats": self._extract_statistics(culture, recommendations)
             }
 
             return {
@@ -846,27 +1166,20 @@ class MenuController:
         """
         if not weather_data:
             return None
-            
-        # verifica a estrutura aninhada completa
-        if weather_data.get("data") and weather_data["data"].get("weather"):
-            weather_array = weather_data["data"]["weather"]
-            if isinstance(weather_array, list) and len(weather_array) > 0:
+
+        # verifica a estrutura aninhada completa e, em seguida, a alternativa
+        # (dados no nível principal)
+        data = weather_data.get("data") or {}
+        for weather_array in (data.get("weather"), weather_data.get("weather")):
+            if isinstance(weather_array, list) and weather_array:
                 return weather_array[0]  # Retorna o primeiro item do array
-            elif isinstance(weather_array, dict):
+            if isinstance(weather_array, dict) and weather_array:
                 return weather_array  # Retorna o dicionário diretamente
-                
-        # verifica estrutura alternativa (dados no nível principal)
-        if weather_data.get("weather"):
-            weather_array = weather_data["weather"]
-            if isinstance(weather_array, list) and len(weather_array) > 0:
-                return weather_array[0]
-            elif isinstance(weather_array, dict):
-                return weather_array
-                
+
         # verifica se os próprios dados possuem as propriedades esperadas
-        if any(key in weather_data for key in ["temperature", "humidity", "wind_speed"]):
+        if any(key in weather_data for key in ("temperature", "humidity", "wind_speed")):
             return weather_data
-            
+
         return None
 
     def _extract_weather_analysis(self, weather_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -881,67 +1194,24 @@ class MenuController:
         """
         if not weather_data:
             return None
-            
-        # verifica na estrutura aninhada
-        if weather_data.get("data") and weather_data["data"].get("analysis"):
-            return weather_data["data"]["analysis"]
-            
-        # verifica no nível principal
-        if weather_data.get("analysis"):
-            return weather_data["analysis"]
-            
-        # verifica estrutura alternativa
-        if weather_data.get("weather_analysis"):
-            return weather_data["weather_analysis"]
-            
-        # tenta construir análise a partir de campos individuais
-        analysis = {}
-        
-        # extrai análise de temperatura, se disponível
-        temperature_analysis = None
-        if weather_data.get("temperature_analysis"):
-            temperature_analysis = weather_data["temperature_analysis"]
-        elif weather_data.get("data") and weather_data["data"].get("temperature_analysis"):
-            temperature_analysis = weather_data["data"]["temperature_analysis"]
-            
-        if temperature_analysis:
-            analysis["temperature"] = temperature_analysis
-            
-        # extrai análise de umidade, se disponível
-        humidity_analysis = None
-        if weather_data.get("humidity_analysis"):
-            humidity_analysis = weather_data["humidity_analysis"]
-        elif weather_data.get("data") and weather_data["data"].get("humidity_analysis"):
-            humidity_analysis = weather_data["data"]["humidity_analysis"]
-            
-        if humidity_analysis:
-            analysis["humidity"] = humidity_analysis
-            
-        # extrai análise de vento, se disponível
-        wind_analysis = None
-        if weather_data.get("wind_analysis"):
-            wind_analysis = weather_data["wind_analysis"]
-        elif weather_data.get("data") and weather_data["data"].get("wind_analysis"):
-            wind_analysis = weather_data["data"]["wind_analysis"]
-            
-        if wind_analysis:
-            analysis["wind"] = wind_analysis
-            
-        # extrai impacto agrícola, se disponível
-        agricultural_impact = None
-        if weather_data.get("agricultural_impact"):
-            agricultural_impact = weather_data["agricultural_impact"]
-        elif weather_data.get("data") and weather_data["data"].get("agricultural_impact"):
-            agricultural_impact = weather_data["data"]["agricultural_impact"]
-            
-        if agricultural_impact:
-            analysis["agricultural_impact"] = agricultural_impact
-            
-        # retorna análise construída se tiver algum dado
+
+        data = weather_data.get("data") or {}
+
+        # verifica na estrutura aninhada, no nível principal e na estrutura alternativa
+        analysis = data.get("analysis") or weather_data.get("analysis") or weather_data.get("weather_analysis")
         if analysis:
             return analysis
-            
-        return None
+
+        # tenta construir análise a partir de campos individuais (temperatura,
+        # umidade, vento e impacto agrícola), no nível principal ou aninhados
+        analysis = {}
+        for source_key, target_key in _WEATHER_ANALYSIS_PARTS:
+            value = weather_data.get(source_key) or data.get(source_key)
+            if value:
+                analysis[target_key] = value
+
+        # retorna análise construída se tiver algum dado
+        return analysis or None
 
     def _extract_soy_specific_data(self, recommendations: Optional[Dict[str, Any]], 
                                   culture_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -1027,15 +1297,9 @@ class MenuController:
                 
                 # regex para extrair valores da produtividade para soja ou cana
                 if culture_data.get("tipo") == "Soja":
-                    match = re.search(
-                        r"Produtividade estimada: (\d+\.?\d*) sacas/ha",
-                        forecast
-                    )
+                    match = _RE_PROD_SOJA.search(forecast)
                 else:
-                    match = re.search(
-                        r"Produtividade estimada: (\d+\.?\d*) ton/ha",
-                        forecast
-                    )
+                    match = _RE_PROD_CANA.search(forecast)
                 
                 if match:
                     result["value"] = float(match.group(1))
@@ -1052,15 +1316,9 @@ class MenuController:
                     
                     # regex para extrair valores com base no tipo de cultura
                     if culture_data.get("tipo") == "Soja":
-                        match = re.search(
-                            r"(\d+) sacas totais estimadas",
-                            prod_text
-                        )
+                        match = _RE_TOTAL_SOJA.search(prod_text)
                     else:
-                        match = re.search(
-                            r"(\d+) toneladas totais estimadas",
-                            prod_text
-                        )
+                        match = _RE_TOTAL_CANA.search(prod_text)
                     
                     if match:
                         result["total"] = int(match.group(1))
@@ -1119,72 +1377,63 @@ class MenuController:
                 sugarcane_specific = culture_data["analise_estatistica"].get("sugarcane_specific", {})
                 if "optimal_planting_period" in sugarcane_specific:
                     return sugarcane_specific["optimal_planting_period"]
-                
-                # se for cana-de-açúcar, verificar nas recomendações específicas
-                if "recomendacoes" in culture_data:
-                    ciclo = culture_data.get("ciclo", "médio")
-                    if ciclo == "curto":
-                        return "Fevereiro a Abril"
-                    elif ciclo == "médio":
-                        return "Janeiro a Março"
-                    elif ciclo == "longo":
-                        return "Outubro a Dezembro"
-
-        # valores padrão por cultura
-        if culture_data.get("tipo") == "Soja":
-            return "Setembro a Novembro"
-        elif culture_data.get("tipo") == "Cana-de-Açúcar":
-            ciclo = culture_data.get("ciclo", "médio")
-            if ciclo == "curto":
-                return "Fevereiro a Abril"
-            elif ciclo == "médio":
-                return "Janeiro a Março"
-            elif ciclo == "longo":
-                return "Outubro a Dezembro"
-            return "Janeiro a Março (padrão)"
-        
-        return "Não disponível"
+
+        # valores padrão por cultura e ciclo
+        tipo = culture_data.get("tipo")
+        period = _OPTIMAL_PERIOD_TABLE.get((tipo, culture_data.get("ciclo", "médio")))
+        if period is None:
+            period = _OPTIMAL_PERIOD_TABLE.get((tipo, None), "Não disponível")
+        return period
 
     def _extract_statistics(self, culture_data: Dict[str, Any], recommendations: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extrai estatísticas da cultura
         """
+        get = culture_data.get
+        comprimento_linha = get("comprimento_linha", 0)
+        metros_lineares_total = get("metros_lineares_total", 0)
         stats = {
-            "area": culture_data.get("area", 0),
-            "espacamento": culture_data.get("espacamento", 0),
-            "linhas_calculadas": culture_data.get("linhas_calculadas", 0),
-            "comprimento_linha": round(culture_data.get("comprimento_linha", 0), 2),
-            "metros_lineares_total": round(culture_data.get("metros_lineares_total", 0), 2),
+            "area": get("area", 0),
+            "espacamento": get("espacamento", 0),
+            "linhas_calculadas": get("linhas_calculadas", 0),
+            # zero (cultura sem linhas) dispensa o arredondamento
+            "comprimento_linha": round(comprimento_linha, 2) if comprimento_linha else comprimento_linha,
+            "metros_lineares_total": round(metros_lineares_total, 2) if metros_lineares_total else metros_lineares_total,
             "efficiency_metrics": {}
         }
 
         # adiciona dados específicos para cana-de-açúcar
-        if culture_data.get("tipo") == "Cana-de-Açúcar" and "recomendacoes" in culture_data:
+        if get("tipo") == "Cana-de-Açúcar" and "recomendacoes" in culture_data:
+            recomendacoes = culture_data["recomendacoes"]
+            ciclo_info = recomendacoes["ciclo_info"]
             stats["sugarcane_specific"] = {
-                "ciclo": culture_data.get("ciclo", "médio"),
-                "duracao": culture_data["recomendacoes"]["ciclo_info"]["duracao"],
-                "descricao": culture_data["recomendacoes"]["ciclo_info"]["descricao"],
-                "espacamento_recomendado": culture_data["recomendacoes"]["espacamento"]["recomendado"],
-                "area_recomendada": culture_data["recomendacoes"]["area"]["recomendado"],
-                "irrigacao_info": culture_data["recomendacoes"]["irrigacao"]
+                "ciclo": get("ciclo", "médio"),
+                "duracao": ciclo_info["duracao"],
+                "descricao": ciclo_info["descricao"],
+                "espacamento_recomendado": recomendacoes["espacamento"]["recomendado"],
+                "area_recomendada": recomendacoes["area"]["recomendado"],
+                "irrigacao_info": recomendacoes["irrigacao"]
             }
 
         # verifica nas recomendações
         if recommendations and "data" in recommendations:
             rec_data = recommendations["data"]
 
-            # métricas de eficiência
-            if "data_analysis" in rec_data and "efficiency_metrics" in rec_data["data_analysis"]:
-                stats["efficiency_metrics"] = rec_data["data_analysis"]["efficiency_metrics"]
+            if "data_analysis" in rec_data:
+                data_analysis = rec_data["data_analysis"]
+
+                # métricas de eficiência
+                if "efficiency_metrics" in data_analysis:
+                    stats["efficiency_metrics"] = data_analysis["efficiency_metrics"]
 
-            # métricas-chave
-            if "data_analysis" in rec_data and "key_metrics" in rec_data["data_analysis"]:
-                key_metrics = rec_data["data_analysis"]["key_metrics"]
-                stats["insumos_totais"] = key_metrics.get("insumos_totais", {
-                    "herbicida": f"{culture_data.get('quantidade_herbicida', 0)} L",
-                    "fertilizante": f"{culture_data.get('quantidade_fertilizante', 0)} kg"
-                })
-                stats["metros_lineares"] = key_metrics.get("metros_lineares", culture_data.get("metros_lineares_total", 0))
+                # métricas-chave
+                if "key_metrics" in data_analysis:
+                    key_metrics = data_analysis["key_metrics"]
+                    stats["insumos_totais"] = key_metrics.get("insumos_totais", {
+                        "herbicida": f"{get('quantidade_herbicida', 0)} L",
+                        "fertilizante": f"{get('quantidade_fertilizante', 0)} kg"
+                    })
+                    stats["metros_lineares"] = key_metrics.get("metros_lineares", metros_lineares_total)
 
         return stats
 
@@ -1197,10 +1446,7 @@ class MenuController:
         Returns:
             Dict[str, Any]: Resultado da operação
         """
-        print("\n----- ENTRADA DE DADOS -----")
-        print("Escolha o tipo de cultura:")
-        print("1. Soja")
-        print("2. Cana-de-Açúcar")
+        sys.stdout.write(_INPUT_MENU)
 
         try:
             culture_type = int(input("Digite o número da cultura: "))
@@ -1211,24 +1457,16 @@ class MenuController:
                     "message": "Tipo de cultura inválido"
                 }
 
-            area = float(input("Área de plantio (hectares): "))
-            espacamento = float(input("Espaçamento entre linhas (metros): "))
+            # demais campos lidos em lote; o terceiro depende da cultura
+            area, espacamento, extra, with_irrigation = self._batch_input(
+                _SOY_INPUT_FIELDS if culture_type == 1 else _CANE_INPUT_FIELDS
+            )
 
             # parâmetros adicionais específicos para cada cultura
-            additional_params = {}
             if culture_type == 1:  # Soja
-                additional_params["variedade"] = input("Variedade da soja (ex: convencional, transgênica): ")
-            elif culture_type == 2:  # Cana-de-Açúcar
-                ciclo_options = {"1": "curto", "2": "médio", "3": "longo"}
-                print("\nEscolha o ciclo da cana:")
-                print("1. Curto (8-10 meses)")
-                print("2. Médio (12-14 meses)")
-                print("3. Longo (16-18 meses)")
-                ciclo_choice = input("Digite o número correspondente ao ciclo: ")
-                additional_params["ciclo"] = ciclo_options.get(ciclo_choice, "médio")
-
-            # pergunta sobre irrigação
-            with_irrigation = input("Adicionar sistema de irrigação? (s/n): ").lower() == 's'
+                additional_params = {"variedade": extra}
+            else:  # Cana-de-Açúcar
+                additional_params = {"ciclo": extra}
 
             # cria cultura usando o controlador
             culture_data = self.culture_controller.create_culture(
@@ -1239,41 +1477,41 @@ class MenuController:
                 **additional_params
             )
 
-            # adiciona ao vetor de dados
-            self.data.append(culture_data)
+            # reaproveita a primeira posição deletada, como em create_culture
+            position = self._pop_deleted_position()
+            if position is not None:
+                self.data[position] = culture_data
+            else:
+                self.data.append(culture_data)
+                position = len(self.data) - 1
+            self._data_version += 1
 
             # exibe recomendações para cana-de-açúcar
             if culture_type == 2 and "recomendacoes" in culture_data:
-                print("\n----- RECOMENDAÇÕES PARA CANA-DE-AÇÚCAR -----")
                 recomendacoes = culture_data["recomendacoes"]
-                
-                print(f"Ciclo: {culture_data['ciclo']} ({recomendacoes['ciclo_info']['duracao']})")
-                print(f"Descrição: {recomendacoes['ciclo_info']['descricao']}")
-                
-                print(f"\nEspaçamento: {recomendacoes['espacamento']['mensagem']}")
-                esp_rec = recomendacoes['espacamento']['recomendado']
-                print(f"  Recomendado: {esp_rec['min']}-{esp_rec['max']} m (ideal: {esp_rec['ideal']} m)")
-                
-                print(f"\nÁrea: {recomendacoes['area']['mensagem']}")
-                area_rec = recomendacoes['area']['recomendado']
-                min_area = area_rec['min']
-                max_area = area_rec['max'] if area_rec['max'] else "sem limite máximo"
-                print(f"  Recomendado: {min_area}-{max_area} ha (ideal: {area_rec['ideal']} ha)")
-                
+                espacamento_rec = recomendacoes['espacamento']
+                area_rec = recomendacoes['area']
                 irrig = recomendacoes['irrigacao']
-                print(f"\nIrrigação: {'Ativada' if irrig['ativa'] else 'Não ativada'}")
-                print(f"  {irrig['mensagem']}")
-                print(f"  Sistema: {irrig['sistema']}")
-                print(f"  Frequência: {irrig['frequencia']}")
-                print(f"  Volume: {irrig['volume']}")
-                print(f"  Eficiência: {irrig['eficiencia']}")
+
+                # bloco inteiro a partir do modelo, numa única escrita
+                sys.stdout.write(_SUGARCANE_RECOMMENDATION_TEMPLATE.format(
+                    ciclo=culture_data['ciclo'],
+                    ciclo_info=recomendacoes['ciclo_info'],
+                    espacamento=espacamento_rec,
+                    esp=espacamento_rec['recomendado'],
+                    area=area_rec,
+                    area_rec=area_rec['recomendado'],
+                    max_area=area_rec['recomendado']['max'] or "sem limite máximo",
+                    irrig=irrig,
+                    irrig_status='Ativada' if irrig['ativa'] else 'Não ativada'
+                ))
 
             return {
                 "status": "success", 
                 "data": self.data, 
                 "message": (
                     "Cultura adicionada com sucesso. ",
-                    f"ID: {len(self.data) - 1}"
+                    f"ID: {position}"
                 ),
             }
 
@@ -1305,22 +1543,26 @@ class MenuController:
                 "message": "Nenhum dado disponível para visualização"
             }
 
-        print("\n----- VISUALIZAÇÃO DE DADOS -----")
+        # monta a listagem inteira e escreve de uma vez
+        lines = ["\n----- VISUALIZAÇÃO DE DADOS -----"]
         for i, item in enumerate(self.data):
-            print(f"\nCultura #{i}:")
-            for key, value in item.items():
-                # não exibe dados muito aninhados como recomendações
-                if key == "recomendacoes":
-                    print(f"  {key}: [Dados detalhados disponíveis]")
-                    continue
-                print(f"  {key}: {value}")
+            if item.get("deleted", False):
+                continue
+            lines.append(f"\nCultura #{i}:")
+            # não exibe dados muito aninhados como recomendações
+            lines.extend(
+                f"  {key}: [Dados detalhados disponíveis]" if key == "recomendacoes" else f"  {key}: {value}"
+                for key, value in item.items()
+            )
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
         # pergunta se usuário deseja realizar cálculos adicionais
         if input("\nDeseja calcular linhas de plantio? (s/n): ").lower() == 's':
             try:
                 idx = int(input("Digite o número da cultura para cálculo: "))
-                if 0 <= idx < len(self.data):
-                    linhas = self.culture_controller.calculate_lines(idx, self.data[idx])
+                if 0 <= idx < len(self.data) and not self.data[idx].get("deleted", False):
+                    linhas = self._cached_lines(idx, self.data[idx])
                     self.data[idx]["linhas_calculadas"] = linhas
                     return {
                         "status": "success", 
@@ -1370,159 +1612,32 @@ class MenuController:
                 "message": "Nenhum dado disponível para atualização"
             }
 
-        print("\n----- ATUALIZAÇÃO DE DADOS -----")
-        for i, item in enumerate(self.data):
-            cultura_tipo = item.get("tipo", "Desconhecida")
-            area = item.get("area", "N/A")
-            print(f"{i}. {cultura_tipo} - Área: {area} ha")
+        sys.stdout.write(_UPDATE_HEADER + self._culture_summary())
 
         try:
             idx = int(input("\nDigite o número da cultura para atualizar: "))
-            if 0 <= idx < len(self.data):
-                print("\nO que deseja atualizar?")
-                print("1. Área de plantio")
-                print("2. Espaçamento entre linhas")
-                
+            if 0 <= idx < len(self.data) and not self.data[idx].get("deleted", False):
+                culture = self.data[idx]
+                is_cane = culture.get("tipo") == "Cana-de-Açúcar"
+
                 # opções adicionais específicas para cada cultura
-                if self.data[idx].get("tipo") == "Cana-de-Açúcar":
-                    print("3. Ciclo da cana-de-açúcar")
-                    print("4. Sistema de irrigação")
+                if is_cane:
+                    sys.stdout.write(_CANE_UPDATE_OPTIONS)
+                    handlers = self._cane_update_handlers
+                else:
+                    sys.stdout.write(_UPDATE_OPTIONS)
+                    handlers = self._update_handlers
 
                 update_choice = int(input("Escolha uma opção: "))
 
-                if update_choice == 1:
-                    new_value = float(input("Nova área (hectares): "))
-                    self.data[idx]["area"] = new_value
-                    # recalcula valores necessários
-                    if "linhas_calculadas" in self.data[idx]:
-                        linhas = self.culture_controller.calculate_lines(idx, self.data[idx])
-                        self.data[idx]["linhas_calculadas"] = linhas
-                    
-                    # recalcula recomendações para cana-de-açúcar
-                    if self.data[idx].get("tipo") == "Cana-de-Açúcar":
-                        recomendacoes = self.culture_controller.validate_sugarcane_parameters(
-                            new_value, 
-                            self.data[idx].get("espacamento", 0),
-                            self.data[idx].get("ciclo", "médio"),
-                            self.data[idx].get("irrigacao", False)
-                        )
-                        self.data[idx]["recomendacoes"] = recomendacoes
-                        
-                        # mostra novas recomendações
-                        print("\n----- NOVAS RECOMENDAÇÕES -----")
-                        print(f"Área: {recomendacoes['area']['mensagem']}")
-
-                    return {
-                        "status": "success", 
-                        "data": self.data, 
-                        "message": (
-                            f"Área da cultura #{idx} atualizada ",
-                            f"para {new_value} ha"
-                        ),
-                    }
-
-                elif update_choice == 2:
-                    new_value = float(input("Novo espaçamento (metros): "))
-                    self.data[idx]["espacamento"] = new_value
-                    # recalcula valores necessários
-                    if "linhas_calculadas" in self.data[idx]:
-                        linhas = self.culture_controller.calculate_lines(idx, self.data[idx])
-                        self.data[idx]["linhas_calculadas"] = linhas
-                        
-                    # recalcula recomendações para cana-de-açúcar
-                    if self.data[idx].get("tipo") == "Cana-de-Açúcar":
-                        recomendacoes = self.culture_controller.validate_sugarcane_parameters(
-                            self.data[idx].get("area", 0),
-                            new_value,
-                            self.data[idx].get("ciclo", "médio"),
-                            self.data[idx].get("irrigacao", False)
-                        )
-                        self.data[idx]["recomendacoes"] = recomendacoes
-                        
-                        # mostra novas recomendações
-                        print("\n----- NOVAS RECOMENDAÇÕES -----")
-                        print(f"Espaçamento: {recomendacoes['espacamento']['mensagem']}")
-
-                    return {
-                        "status": "success", 
-                        "data": self.data, 
-                        "message": (
-                            f"Espaçamento da cultura #{idx} ",
-                            f"atualizado para {new_value} m"
-                        ),
-                    }
-                
-                # opções específicas para cana-de-açúcar
-                elif update_choice == 3 and self.data[idx].get("tipo") == "Cana-de-Açúcar":
-                    print("\nEscolha o novo ciclo da cana:")
-                    print("1. Curto (8-10 meses)")
-                    print("2. Médio (12-14 meses)")
-                    print("3. Longo (16-18 meses)")
-                    
-                    ciclo_options = {"1": "curto", "2": "médio", "3": "longo"}
-                    ciclo_choice = input("Digite o número correspondente ao ciclo: ")
-                    new_ciclo = ciclo_options.get(ciclo_choice, "médio")
-                    
-                    self.data[idx]["ciclo"] = new_ciclo
-                    
-                    # recalcula recomendações
-                    recomendacoes = self.culture_controller.validate_sugarcane_parameters(
-                        self.data[idx].get("area", 0),
-                        self.data[idx].get("espacamento", 0),
-                        new_ciclo,
-                        self.data[idx].get("irrigacao", False)
-                    )
-                    self.data[idx]["recomendacoes"] = recomendacoes
-                    
-                    # mostra novas recomendações
-                    print("\n----- NOVAS RECOMENDAÇÕES -----")
-                    print(f"Ciclo: {new_ciclo} ({recomendacoes['ciclo_info']['duracao']})")
-                    print(f"Descrição: {recomendacoes['ciclo_info']['descricao']}")
-                    
-                    return {
-                        "status": "success", 
-                        "data": self.data, 
-                        "message": (
-                            f"Ciclo da cultura #{idx} ",
-                            f"atualizado para {new_ciclo}"
-                        ),
-                    }
-                
-                elif update_choice == 4 and self.data[idx].get("tipo") == "Cana-de-Açúcar":
-                    current_irrigation = self.data[idx].get("irrigacao", False)
-                    new_irrigation = not current_irrigation
-                    
-                    self.data[idx]["irrigacao"] = new_irrigation
-                    
-                    # recalcula recomendações
-                    recomendacoes = self.culture_controller.validate_sugarcane_parameters(
-                        self.data[idx].get("area", 0),
-                        self.data[idx].get("espacamento", 0),
-                        self.data[idx].get("ciclo", "médio"),
-                        new_irrigation
-                    )
-                    self.data[idx]["recomendacoes"] = recomendacoes
-                    
-                    # mostra novas recomendações
-                    print("\n----- NOVAS RECOMENDAÇÕES -----")
-                    irrig = recomendacoes['irrigacao']
-                    print(f"Irrigação: {'Ativada' if irrig['ativa'] else 'Não ativada'}")
-                    print(f"  {irrig['mensagem']}")
-                    
-                    return {
-                        "status": "success", 
-                        "data": self.data, 
-                        "message": (
-                            f"Sistema de irrigação da cultura #{idx} ",
-                            f"{'ativado' if new_irrigation else 'desativado'}"
-                        ),
-                    }
-                else:
+                handler = handlers.get(update_choice)
+                if handler is None:
                     return {
                         "status": "error",
                         "data": self.data,
                         "message": "Opção de atualização inválida"
                     }
+                return handler(idx, culture, is_cane)
             else:
                 return {
                     "status": "error",
@@ -1544,6 +1659,231 @@ class MenuController:
                 "message": f"Erro ao atualizar: {str(e)}"
             }
 
+    def _update_area(self, idx: int, culture: Dict[str, Any], is_cane: bool) -> Dict[str, Any]:
+        """
+        Atualiza a área de plantio da cultura (CLI)
+
+        Args:
+            idx (int): Índice da cultura em self.data
+            culture (Dict[str, Any]): Dados da cultura
+            is_cane (bool): Se a cultura é cana-de-açúcar
+
+        Returns:
+            Dict[str, Any]: Resultado da operação
+        """
+        new_value = float(input("Nova área (hectares): "))
+        # mesmo valor: linhas e recomendações continuam válidas
+        if new_value == culture.get("area"):
+            return self._unchanged_result(f"A área da cultura #{idx} já é {new_value} ha")
+
+        culture["area"] = new_value
+        self._data_version += 1
+        # recalcula valores necessários
+        if "linhas_calculadas" in culture:
+            linhas = self._cached_lines(idx, culture)
+            culture["linhas_calculadas"] = linhas
+
+        # recalcula recomendações para cana-de-açúcar
+        if is_cane:
+            recomendacoes = self._validate_sugarcane(
+                new_value,
+                culture.get("espacamento", 0),
+                culture.get("ciclo", "médio"),
+                culture.get("irrigacao", False)
+            )
+            culture["recomendacoes"] = recomendacoes
+
+            # mostra novas recomendações
+            sys.stdout.write(
+                "\n----- NOVAS RECOMENDAÇÕES -----\n"
+                f"Área: {recomendacoes['area']['mensagem']}\n"
+            )
+
+        return {
+            "status": "success",
+            "data": self.data,
+            "message": (
+                f"Área da cultura #{idx} atualizada ",
+                f"para {new_value} ha"
+            ),
+        }
+
+    def _update_espacamento(self, idx: int, culture: Dict[str, Any], is_cane: bool) -> Dict[str, Any]:
+        """
+        Atualiza o espaçamento entre linhas da cultura (CLI)
+
+        Args:
+            idx (int): Índice da cultura em self.data
+            culture (Dict[str, Any]): Dados da cultura
+            is_cane (bool): Se a cultura é cana-de-açúcar
+
+        Returns:
+            Dict[str, Any]: Resultado da operação
+        """
+        new_value = float(input("Novo espaçamento (metros): "))
+        # mesmo valor: linhas e recomendações continuam válidas
+        if new_value == culture.get("espacamento"):
+            return self._unchanged_result(f"O espaçamento da cultura #{idx} já é {new_value} m")
+
+        culture["espacamento"] = new_value
+        # recalcula valores necessários
+        if "linhas_calculadas" in culture:
+            linhas = self._cached_lines(idx, culture)
+            culture["linhas_calculadas"] = linhas
+
+        # recalcula recomendações para cana-de-açúcar
+        if is_cane:
+            recomendacoes = self._validate_sugarcane(
+                culture.get("area", 0),
+                new_value,
+                culture.get("ciclo", "médio"),
+                culture.get("irrigacao", False)
+            )
+            culture["recomendacoes"] = recomendacoes
+
+            # mostra novas recomendações
+            sys.stdout.write(
+                "\n----- NOVAS RECOMENDAÇÕES -----\n"
+                f"Espaçamento: {recomendacoes['espacamento']['mensagem']}\n"
+            )
+
+        return {
+            "status": "success",
+            "data": self.data,
+            "message": (
+                f"Espaçamento da cultura #{idx} ",
+                f"atualizado para {new_value} m"
+            ),
+        }
+
+    def _update_ciclo(self, idx: int, culture: Dict[str, Any], is_cane: bool) -> Dict[str, Any]:
+        """
+        Atualiza o ciclo da cana-de-açúcar (CLI)
+
+        Args:
+            idx (int): Índice da cultura em self.data
+            culture (Dict[str, Any]): Dados da cultura
+            is_cane (bool): Se a cultura é cana-de-açúcar (sempre verdadeiro nesta opção)
+
+        Returns:
+            Dict[str, Any]: Resultado da operação
+        """
+        sys.stdout.write(_NEW_CICLO_MENU)
+
+        ciclo_choice = input("Digite o número correspondente ao ciclo: ")
+        new_ciclo = _CICLO_CHOICES.get(ciclo_choice, "médio")
+        # mesmo ciclo: as recomendações continuam válidas
+        if new_ciclo == culture.get("ciclo"):
+            return self._unchanged_result(f"O ciclo da cultura #{idx} já é {new_ciclo}")
+
+        culture["ciclo"] = new_ciclo
+
+        # recalcula recomendações
+        recomendacoes = self._validate_sugarcane(
+            culture.get("area", 0),
+            culture.get("espacamento", 0),
+            new_ciclo,
+            culture.get("irrigacao", False)
+        )
+        culture["recomendacoes"] = recomendacoes
+
+        # mostra novas recomendações
+        sys.stdout.write(
+            "\n----- NOVAS RECOMENDAÇÕES -----\n"
+            f"Ciclo: {new_ciclo} ({recomendacoes['ciclo_info']['duracao']})\n"
+            f"Descrição: {recomendacoes['ciclo_info']['descricao']}\n"
+        )
+
+        return {
+            "status": "success",
+            "data": self.data,
+            "message": (
+                f"Ciclo da cultura #{idx} ",
+                f"atualizado para {new_ciclo}"
+            ),
+        }
+
+    def _update_irrigacao(self, idx: int, culture: Dict[str, Any], is_cane: bool) -> Dict[str, Any]:
+        """
+        Alterna o sistema de irrigação da cana-de-açúcar (CLI)
+
+        Args:
+            idx (int): Índice da cultura em self.data
+            culture (Dict[str, Any]): Dados da cultura
+            is_cane (bool): Se a cultura é cana-de-açúcar (sempre verdadeiro nesta opção)
+
+        Returns:
+            Dict[str, Any]: Resultado da operação
+        """
+        current_irrigation = culture.get("irrigacao", False)
+        new_irrigation = not current_irrigation
+
+        culture["irrigacao"] = new_irrigation
+
+        # recalcula recomendações
+        recomendacoes = self._validate_sugarcane(
+            culture.get("area", 0),
+            culture.get("espacamento", 0),
+            culture.get("ciclo", "médio"),
+            new_irrigation
+        )
+        culture["recomendacoes"] = recomendacoes
+
+        # mostra novas recomendações
+        irrig = recomendacoes['irrigacao']
+        sys.stdout.write(
+            "\n----- NOVAS RECOMENDAÇÕES -----\n"
+            f"Irrigação: {'Ativada' if irrig['ativa'] else 'Não ativada'}\n"
+            f"  {irrig['mensagem']}\n"
+        )
+
+        return {
+            "status": "success",
+            "data": self.data,
+            "message": (
+                f"Sistema de irrigação da cultura #{idx} ",
+                f"{'ativado' if new_irrigation else 'desativado'}"
+            ),
+        }
+
+    def _unchanged_result(self, message: str) -> Dict[str, Any]:
+        """
+        Resultado de uma atualização (CLI) cujo novo valor é igual ao atual
+
+        Args:
+            message (str): Descrição do valor mantido
+
+        Returns:
+            Dict[str, Any]: Resultado da operação, sem alterações nos dados
+        """
+        return {
+            "status": "info",
+            "data": self.data,
+            "message": f"{message}; nada foi alterado"
+        }
+
+    def _culture_summary(self) -> str:
+        """
+        Monta a listagem "índice. tipo - Área" usada nos menus de atualização e deleção
+
+        A listagem só é refeita quando a versão dos dados muda.
+
+        Returns:
+            str: Uma linha por cultura não deletada, cada uma terminada em quebra de linha
+        """
+        cache_key = (self._data_version, id(self.data), len(self.data))
+        cached_key, cached_summary = self._summary_cache
+        if cached_key == cache_key:
+            return cached_summary
+
+        summary = "".join(
+            f"{i}. {item.get('tipo', 'Desconhecida')} - Área: {item.get('area', 'N/A')} ha\n"
+            for i, item in enumerate(self.data)
+            if not item.get("deleted", False)
+        )
+        self._summary_cache = (cache_key, summary)
+        return summary
+
     def _handle_data_deletion(self) -> Dict[str, Any]:
         """
         Processa a deleção de dados (modo CLI)
@@ -1558,11 +1898,7 @@ class MenuController:
                 "message": "Nenhum dado disponível para deleção"
             }
 
-        print("\n----- DELEÇÃO DE DADOS -----")
-        for i, item in enumerate(self.data):
-            cultura_tipo = item.get("tipo", "Desconhecida")
-            area = item.get("area", "N/A")
-            print(f"{i}. {cultura_tipo} - Área: {area} ha")
+        sys.stdout.write(_DELETE_HEADER + self._culture_summary())
 
         try:
             idx = int(input("\nDigite o número da cultura para deletar (ou -1 para cancelar): "))
@@ -1574,8 +1910,9 @@ class MenuController:
                     "message": "Operação de deleção cancelada"
                 }
 
-            if 0 <= idx < len(self.data):
-                removed_item = self.data.pop(idx)
+            if 0 <= idx < len(self.data) and not self.data[idx].get("deleted", False):
+                # mesmo marcador da API: os números das demais culturas não mudam
+                removed_item = self._mark_deleted(idx)
                 return {
                     "status": "success", 
                     "data": self.data, 
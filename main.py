@@ -22,6 +22,9 @@ def parse_args():
     output_format.add_argument('--text', action='store_true', help='Saída em formato de texto')
     output_format.add_argument('--json', action='store_true', default=True, help='Saída em formato JSON (padrão)')
 
+    # análise estatística no R (ativada por padrão)
+    parser.add_argument('--no-r', action='store_true', help='Não envia as culturas para análise estatística no R')
+
     return parser.parse_args()
 
 def main():
@@ -30,7 +33,7 @@ def main():
     output_format = 'text' if args.text else 'json'
 
     # Inicializa controladores
-    culture_controller = CultureController()
+    culture_controller = CultureController(r_enabled=not args.no_r)
     menu_controller = MenuController(culture_controller)
 
     try:
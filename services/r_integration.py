@@ -8,12 +8,17 @@ Este módulo fornece uma interface para comunicação com scripts R,
 permitindo análises estatísticas avançadas de dados agrícolas.
 """
 
+import atexit
 import json
 import logging
 import subprocess
 import os
+import select
+import shutil
 import tempfile
+import threading
 import time
+import weakref
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
@@ -26,6 +31,7 @@ R_SCRIPTS_DIR = Path(os.path.dirname(os.path.dirname(__file__))) / "r"
 API_SCRIPT = R_SCRIPTS_DIR / "api.R"
 WEATHER_SCRIPT = R_SCRIPTS_DIR / "modules" / "weather_analysis.R"
 RECOMMENDATIONS_SCRIPT = R_SCRIPTS_DIR / "modules" / "recommendations.R"
+DAEMON_SCRIPT = R_SCRIPTS_DIR / "daemon.R"
 
 
 class RExecutionError(Exception):
@@ -33,6 +39,16 @@ class RExecutionError(Exception):
     pass
 
 
+def is_r_available() -> bool:
+    """
+    Verifica se o Rscript está instalado e acessível no PATH.
+
+    Returns:
+        bool: True se o Rscript foi encontrado
+    """
+    return shutil.which("Rscript") is not None
+
+
 def _validate_data(data: Dict[str, Any]) -> bool:
     """
     Valida os dados antes de enviar para o R.
@@ -58,6 +74,24 @@ def _validate_data(data: Dict[str, Any]) -> bool:
     return True
 
 
+def _json_default(obj: Any) -> Any:
+    """
+    Converte valores não suportados pelo json (ex.: escalares e arrays NumPy).
+    
+    Args:
+        obj: Objeto que o codificador json não sabe serializar
+        
+    Returns:
+        Any: Representação serializável do objeto
+        
+    Raises:
+        TypeError: Se o objeto não puder ser convertido
+    """
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Objeto do tipo {type(obj).__name__} não é serializável em JSON")
+
+
 def _create_temp_file(data: Dict[str, Any]) -> str:
     """
     Cria um arquivo temporário com os dados em formato JSON.
@@ -72,8 +106,12 @@ def _create_temp_file(data: Dict[str, Any]) -> str:
         ValueError: Se os dados não puderem ser serializados para JSON
     """
     try:
-        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False) as tmp:
-            json.dump(data, tmp, ensure_ascii=False)
+        # json.dumps usa o codificador em C de uma só vez (json.dump gera o
+        # documento em pedaços pelo codificador em Python) e a saída compacta
+        # reduz o volume lido pelo R
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+        with tempfile.NamedTemporaryFile(mode='w+', suffix='.json', delete=False, encoding='utf-8') as tmp:
+            tmp.write(payload)
             return tmp.name
     except Exception as e:
         logger.error(f"Erro ao criar arquivo temporário: {str(e)}")
@@ -328,12 +366,174 @@ def _execute_r_script(script_path: Path, input_file: str, timeout: int = 60) ->
         logger.error(f"Erro inesperado ao executar script R: {str(e)}")
         raise RExecutionError(f"Erro inesperado: {str(e)}")
 
-def send_to_r_for_analysis(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+# sessões R ainda vivas, encerradas uma única vez na saída do interpretador
+_live_sessions: "weakref.WeakSet[RSession]" = weakref.WeakSet()
+
+
+def _close_live_sessions() -> None:
+    """Encerra os daemons R das sessões que ainda existem."""
+    for session in list(_live_sessions):
+        session.close()
+
+
+atexit.register(_close_live_sessions)
+
+
+class RSession:
+    """
+    Processo R persistente que executa o api.R sem reiniciar o interpretador.
+
+    O daemon (r/daemon.R) recebe o caminho do arquivo JSON de entrada pela
+    entrada padrão e devolve a resposta no stdout, terminada por uma linha
+    marcadora. O processo é iniciado na primeira chamada e recriado
+    automaticamente se morrer ou deixar de responder.
+    """
+
+    END_MARKER = b"<<<FARMTECH_END>>>"
+
+    def __init__(self, script_path: Path = DAEMON_SCRIPT):
+        self.script_path = script_path
+        self.available = os.name == "posix" and script_path.exists()
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        _live_sessions.add(self)
+
+    def _ensure_process(self) -> subprocess.Popen:
+        """Inicia o daemon R se ele ainda não estiver em execução."""
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+
+        logger.info(f"Iniciando processo R persistente: {self.script_path}")
+        try:
+            self._process = subprocess.Popen(
+                ['Rscript', str(self.script_path)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0
+            )
+        except OSError as e:
+            # sem Rscript disponível não há por que tentar novamente
+            self.available = False
+            raise RExecutionError(f"Não foi possível iniciar o processo R: {str(e)}")
+        return self._process
+
+    def close(self) -> None:
+        """Encerra o daemon R, se estiver em execução."""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except Exception:
+            process.kill()
+        finally:
+            process.stdout.close()
+
+    def execute(self, input_file: str, timeout: int = 60) -> Dict[str, Any]:
+        """
+        Executa o api.R no daemon para o arquivo de entrada informado.
+
+        Args:
+            input_file: Caminho para o arquivo de entrada JSON
+            timeout: Tempo máximo de espera pela resposta em segundos
+
+        Returns:
+            Dict[str, Any]: Resultado da execução do script R
+
+        Raises:
+            RExecutionError: Se o daemon falhar; o arquivo de entrada é
+            preservado para que o chamador possa tentar outro transporte
+        """
+        with self._lock:
+            try:
+                process = self._ensure_process()
+                process.stdin.write(f"{input_file}\n".encode("utf-8"))
+                process.stdin.flush()
+                output = self._read_response(process, timeout)
+            except RExecutionError:
+                self.close()
+                raise
+            except Exception as e:
+                self.close()
+                raise RExecutionError(f"Falha na comunicação com o processo R: {str(e)}")
+
+        if not output.strip():
+            logger.warning("Script R não retornou dados")
+            result = {"status": "warning", "message": "Nenhum resultado obtido do R"}
+        else:
+            try:
+                result = json.loads(output)
+            except json.JSONDecodeError as e:
+                # mantém o arquivo de entrada para a nova tentativa via Rscript
+                error_msg = f"Erro ao decodificar JSON da saída do R: {str(e)}"
+                logger.error(f"{error_msg}\nSaída: {output[:200]}...")
+                raise RExecutionError(error_msg)
+
+        # limpa o arquivo temporário só depois de uma resposta válida
+        try:
+            os.unlink(input_file)
+        except Exception as e:
+            logger.warning(f"Falha ao remover arquivo temporário {input_file}: {str(e)}")
+
+        return result
+
+    def _read_response(self, process: subprocess.Popen, timeout: int) -> str:
+        """Lê o stdout do daemon até a linha marcadora ou até o timeout."""
+        deadline = time.monotonic() + timeout
+        fd = process.stdout.fileno()
+        buffer = bytearray()
+
+        while True:
+            end = buffer.find(self.END_MARKER)
+            if end != -1:
+                return buffer[:end].decode("utf-8")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RExecutionError(f"Timeout ao executar script R ({timeout}s)")
+
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                continue
+
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise RExecutionError("Processo R encerrado inesperadamente")
+            buffer.extend(chunk)
+
+
+def _run_api_script(input_file: str, session: Optional[RSession] = None,
+                    timeout: int = 60) -> Dict[str, Any]:
+    """
+    Executa o api.R pelo daemon persistente, se disponível, ou via Rscript.
+
+    Args:
+        input_file: Caminho para o arquivo de entrada JSON
+        session: Sessão R persistente opcional
+        timeout: Tempo máximo de execução em segundos
+
+    Returns:
+        Dict[str, Any]: Resultado da execução do script R
+    """
+    if session is not None and session.available:
+        try:
+            return session.execute(input_file, timeout)
+        except RExecutionError as e:
+            logger.warning(f"Sessão R persistente indisponível, usando Rscript: {str(e)}")
+
+    return _execute_r_script(API_SCRIPT, input_file, timeout)
+
+
+def send_to_r_for_analysis(data: Dict[str, Any],
+                           session: Optional[RSession] = None) -> Optional[Dict[str, Any]]:
     """
     Envia dados para análise estatística em R.
 
     Args:
         data: Dados da cultura a serem analisados
+        session: Sessão R persistente opcional (evita iniciar o Rscript a cada chamada)
 
     Returns:
         Optional[Dict[str, Any]]: Resultados da análise R ou None se falhar
@@ -349,7 +549,7 @@ def send_to_r_for_analysis(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         logger.debug(f"Arquivo temporário criado: {tmp_filename}")
         
         # executa script R
-        return _execute_r_script(API_SCRIPT, tmp_filename)
+        return _run_api_script(tmp_filename, session)
         
     except ValueError as e:
         logger.error(f"Dados inválidos: {str(e)}")
@@ -365,6 +565,67 @@ def send_to_r_for_analysis(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         return None
 
 
+def send_to_r_for_analysis_bulk(cultures_data: List[Dict[str, Any]],
+                                session: Optional[RSession] = None) -> Optional[List[Optional[Dict[str, Any]]]]:
+    """
+    Envia várias culturas para análise em R em uma única execução do script.
+
+    Cada cultura é analisada individualmente pelo R (mesmo resultado de
+    send_to_r_for_analysis), mas o custo de iniciar o Rscript é pago uma vez.
+
+    Args:
+        cultures_data: Lista de dicionários com os dados das culturas
+        session: Sessão R persistente opcional
+
+    Returns:
+        Optional[List[Optional[Dict[str, Any]]]]: Resultados na mesma ordem da
+        entrada (None para itens inválidos) ou None se falhar
+    """
+    try:
+        # valida dados
+        if not isinstance(cultures_data, list) or len(cultures_data) == 0:
+            logger.error("Dados inválidos para análise em lote: lista vazia ou tipo inválido")
+            return None
+
+        valid_indices = [i for i, data in enumerate(cultures_data) if _validate_data(data)]
+        if not valid_indices:
+            logger.error("Validação de dados falhou para todas as culturas do lote")
+            return None
+
+        # cria arquivo temporário com todas as amostras
+        tmp_filename = _create_temp_file({
+            "batch": [cultures_data[i] for i in valid_indices]
+        })
+        logger.debug(f"Arquivo temporário criado: {tmp_filename}")
+
+        # executa script R com timeout estendido para o lote
+        result = _run_api_script(tmp_filename, session, timeout=120)
+
+        batch_results = result.get("batch") if isinstance(result, dict) else None
+        if not isinstance(batch_results, list) or len(batch_results) != len(valid_indices):
+            logger.warning("Resultado da análise em lote não contém dados esperados")
+            return None
+
+        # reposiciona os resultados de acordo com os índices originais
+        results: List[Optional[Dict[str, Any]]] = [None] * len(cultures_data)
+        for i, analysis in zip(valid_indices, batch_results):
+            results[i] = analysis if isinstance(analysis, dict) else None
+        return results
+
+    except ValueError as e:
+        logger.error(f"Dados inválidos: {str(e)}")
+        return None
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return None
+    except RExecutionError:
+        # erro já foi logado pela função _execute_r_script
+        return None
+    except Exception as e:
+        logger.error(f"Erro inesperado na análise em lote: {str(e)}")
+        return None
+
+
 def get_weather_data(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """
     Obtém dados meteorológicos através do script R.
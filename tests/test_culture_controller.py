@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import unittest
+
+from controllers.culture_controller import CultureController
+
+logging.disable(logging.CRITICAL)
+
+
+class FormatSummaryStatsTest(unittest.TestCase):
+    """Testes da formatação vetorizada das estatísticas do R"""
+
+    def setUp(self):
+        self.controller = CultureController(r_enabled=False)
+
+    def test_rounds_like_builtin_round(self):
+        # 2.675 é representado como 2.67499999..., round() dá 2.67 e np.round 2.68
+        stats = {"mean": 10.0, "std_dev": 1.0, "n": 4, "conf_low": 2.675, "conf_high": 3.675}
+        formatted = self.controller._format_summary_stats({"area": stats})["area"]
+
+        self.assertEqual(formatted["intervalo_confianca"], [round(2.675, 2), round(3.675, 2)])
+        self.assertEqual(formatted["intervalo_confianca"], [2.67, 3.67])
+
+    def test_matches_scalar_formulas(self):
+        stats = {"mean": 26.75, "std_dev": 0.7155, "n": 7}
+        formatted = self.controller._format_summary_stats({"area": stats})["area"]
+
+        margin = 1.96 * stats["std_dev"] / (stats["n"] ** 0.5)
+        self.assertEqual(formatted["coeficiente_variacao"], round((stats["std_dev"] / stats["mean"]) * 100, 2))
+        self.assertEqual(formatted["erro_padrao"], round(stats["std_dev"] / (stats["n"] ** 0.5), 2))
+        self.assertEqual(
+            formatted["intervalo_confianca"],
+            [round(stats["mean"] - margin, 2), round(stats["mean"] + margin, 2)]
+        )
+
+    def test_batch_matches_single(self):
+        summaries = [
+            {"area": {"mean": 2.675, "std_dev": 0.01, "n": 3}},
+            {"area": {"mean": 0, "std_dev": 1.005, "n": 0}}
+        ]
+        batch = self.controller._format_summary_stats_batch(summaries)
+
+        for summary, formatted in zip(summaries, batch):
+            self.assertEqual(formatted, self.controller._format_summary_stats(summary))
+
+
+if __name__ == "__main__":
+    unittest.main()
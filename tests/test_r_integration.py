@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import gc
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+import weakref
+
+from services import r_integration
+from services.r_integration import RSession
+
+logging.disable(logging.CRITICAL)
+
+
+def _write_input(content: str) -> str:
+    """Grava o conteúdo num arquivo temporário e retorna o caminho"""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def _remove_if_exists(path: str) -> None:
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+class RSessionTrackingTest(unittest.TestCase):
+    """Testes do registro das sessões encerradas na saída do interpretador"""
+
+    def test_session_tracked_until_collected(self):
+        session = RSession()
+        self.assertIn(session, r_integration._live_sessions)
+
+        ref = weakref.ref(session)
+        del session
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+@unittest.skipUnless(shutil.which("Rscript"), "Rscript não disponível")
+class RSessionProtocolTest(unittest.TestCase):
+    """Testes do protocolo do daemon R (resposta terminada pela linha marcadora)"""
+
+    def setUp(self):
+        self.session = RSession()
+        self.addCleanup(self.session.close)
+        self.culture = {"tipo": "Soja", "area": 10.0, "espacamento": 0.5}
+
+    def _execute(self, content: str):
+        path = _write_input(content)
+        self.addCleanup(_remove_if_exists, path)
+        return self.session.execute(path, timeout=120)
+
+    def test_reply_read_up_to_marker(self):
+        process = self.session._ensure_process()
+        missing = os.path.join(tempfile.gettempdir(), "farmtech_inexistente.json")
+        process.stdin.write(f"{missing}\n".encode("utf-8"))
+        process.stdin.flush()
+
+        output = self.session._read_response(process, timeout=120)
+        result = json.loads(output)
+
+        self.assertNotIn(RSession.END_MARKER.decode(), output)
+        self.assertEqual(result["status"], "error")
+
+    def test_same_process_serves_consecutive_requests(self):
+        first = self._execute(json.dumps(self.culture))
+        pid = self.session._process.pid
+        second = self._execute(json.dumps(self.culture))
+
+        self.assertIn("status", first)
+        self.assertIn("status", second)
+        self.assertEqual(self.session._process.pid, pid)
+
+    def test_recovers_after_invalid_input(self):
+        error = self._execute("{isto não é json")
+        pid = self.session._process.pid
+        result = self._execute(json.dumps(self.culture))
+
+        self.assertEqual(error["status"], "error")
+        self.assertIn("status", result)
+        self.assertEqual(self.session._process.pid, pid)
+
+
+if __name__ == "__main__":
+    unittest.main()